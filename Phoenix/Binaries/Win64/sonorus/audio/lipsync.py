@@ -10,14 +10,19 @@ Gaps are bounded with closed mouth (jaw=0) at start/end to prevent overlap.
 """
 import os
 import sys
-import json
+import threading
 import time
 import re
+import math
+import heapq
+import string
+from collections import OrderedDict
+from operator import itemgetter
 
 # Add parent to path for utils imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.settings import SETTINGS_FILE
+from utils.settings import load_settings_cached
 
 # Numpy for amplitude analysis
 try:
@@ -27,10 +32,32 @@ except ImportError:
     NUMPY_AVAILABLE = False
     print("[WARN] Numpy not available - amplitude gap-fill disabled")
 
+# Numba for the RMS -> jaw kernel (optional, numpy path used otherwise)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Latched when the Numba kernel fails (compile, stale cache, call); numpy is used after
+_rms_kernel_failed = False
+
+
+def _disable_rms_kernel(error):
+    """Fall back to the numpy RMS path for the rest of the session."""
+    global _rms_kernel_failed
+    if not _rms_kernel_failed:
+        _rms_kernel_failed = True
+        print(f"[Lipsync] Numba RMS kernel failed, using numpy: {error}")
+
 # Toggle for amplitude-based gap filling (for vocal bursts like [laughs], [sighs])
 # Set to False to disable gap-filling entirely
 AMPLITUDE_GAP_FILL_ENABLED = False  # Toggle: True = enabled, False = disabled
 
+# Verbose per-gap/per-frame lipsync logging (console prints are slow on Windows)
+# Set SONORUS_LIPSYNC_DEBUG=1 to enable while debugging gap-fill
+LIPSYNC_DEBUG = os.getenv("SONORUS_LIPSYNC_DEBUG", "") == "1"
+
 # Gruut for phoneme conversion
 try:
     from gruut import sentences
@@ -52,15 +79,12 @@ def set_lua_socket(socket):
 
 
 def get_language():
-    """Get language from settings.json, fallback to env"""
+    """Get language from settings.json (mtime-cached load), fallback to env"""
     try:
-        if os.path.exists(SETTINGS_FILE):
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-            # Inworld uses EN_US format, Gruut uses en-us format
-            lang = settings.get('tts', {}).get('inworld', {}).get('language', 'EN_US')
-            # Convert EN_US -> en-us for Gruut
-            return lang.lower().replace('_', '-')
+        # Inworld uses EN_US format, Gruut uses en-us format
+        lang = load_settings_cached().get('tts', {}).get('inworld', {}).get('language', 'EN_US')
+        # Convert EN_US -> en-us for Gruut
+        return lang.lower().replace('_', '-')
     except:
         pass
     return os.getenv("SONORUS_LANG", "en-us")
@@ -151,6 +175,22 @@ DEFAULT_VISEME = {"jaw": 0.15, "smile": 0.0, "funnel": 0.0}
 # Silence/rest viseme
 REST_VISEME = {"jaw": 0.0, "smile": 0.0, "funnel": 0.0}
 
+# Mouth closure after the final chunk: 200ms in 4 steps, lerping to REST_VISEME
+CLOSURE_STEPS = 4
+CLOSURE_DURATION = 0.2
+# (time offset, remaining fraction) per step: (0.05, 0.75) ... (0.2, 0.0)
+CLOSURE_RAMP = tuple(
+    (i * CLOSURE_DURATION / CLOSURE_STEPS, 1 - i / CLOSURE_STEPS)
+    for i in range(1, CLOSURE_STEPS + 1)
+)
+
+# Stress markers (ˈ ˌ) and digits stripped from Gruut phonemes before lookup
+STRIP_TABLE = str.maketrans('', '', 'ˈˌ0123456789')
+
+# Resolved phoneme -> viseme lookups (exact, cleaned and first-char variants).
+# Seeded with VISEME_MAP; unseen phonemes are resolved once and memoized.
+_VISEME_LOOKUP = dict(VISEME_MAP)
+
 # ============================================
 # Amplitude-based Gap Filling
 # ============================================
@@ -186,6 +226,69 @@ BURST_MODIFIERS = {
     'yawn': {'smile': 0, 'funnel': 0.5},
 }
 
+def _build_tag_to_base():
+    """Map each audio burst tag to its BURST_MODIFIERS base form."""
+    mapping = {}
+    for tag in AUDIO_BURST_TAGS:
+        for base in BURST_MODIFIERS:
+            if tag == base or tag.startswith(base):
+                mapping[tag] = base
+                break
+    return mapping
+
+
+def _build_burst_re(tag_to_base: dict):
+    """
+    Compile one whitelist pattern, e.g. r'\[(?:(?P<laugh>laughing|laughs|laugh)|...)\]'.
+
+    Each base gets a named group over its inflections, so a match both
+    validates the tag and names its base (match.lastgroup).
+    """
+    by_base = {base: [] for base in BURST_MODIFIERS}
+    for tag, base in tag_to_base.items():
+        by_base[base].append(tag)
+    groups = '|'.join(
+        f"(?P<{base}>{'|'.join(sorted(tags, key=len, reverse=True))})"
+        for base, tags in by_base.items() if tags
+    )
+    return re.compile(rf'\[(?:{groups})\]', re.IGNORECASE)
+
+
+# Audio burst tag -> base form (e.g. 'laughing' -> 'laugh').
+# Tags without a modifier base (e.g. 'cough') are not gap-fill triggers.
+_TAG_TO_BASE = _build_tag_to_base()
+
+# Whitelisted burst tags only, compiled once
+_BURST_RE = _build_burst_re(_TAG_TO_BASE)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _rms_to_jaw(samples, frame_samples, n_frames):
+        """Fused per-frame RMS, silence threshold and jaw curve over int16 samples."""
+        out = np.empty(n_frames, dtype=np.float64)
+        for f in range(n_frames):
+            base = f * frame_samples
+            acc = 0
+            for k in range(frame_samples):
+                x = np.int64(samples[base + k])
+                acc += x * x
+            rms = math.sqrt(acc / frame_samples) * (1.0 / 32768.0)
+            if rms < 0.02:
+                out[f] = 0.0
+            else:
+                out[f] = min(1.0, (rms - 0.02) * 4.0) ** 0.7
+        return out
+
+
+def pcm_to_samples(pcm_data: bytes):
+    """
+    View raw 16-bit PCM bytes as an int16 sample array (no copy).
+
+    A trailing odd byte, if any, is ignored.
+    """
+    return np.frombuffer(pcm_data, dtype=np.int16, count=len(pcm_data) // 2)
+
 
 def amplitude_visemes_for_audio(pcm_data: bytes, sample_rate: int = 44100,
                                  frame_ms: int = 16) -> list:
@@ -203,43 +306,73 @@ def amplitude_visemes_for_audio(pcm_data: bytes, sample_rate: int = 44100,
     """
     if not NUMPY_AVAILABLE or not pcm_data:
         return []
+    return amplitude_visemes_for_samples(pcm_to_samples(pcm_data), sample_rate, frame_ms)
 
-    try:
-        samples = np.frombuffer(pcm_data, dtype=np.int16).astype(np.float32)
-        samples = samples / 32768.0  # Normalize to -1 to 1
 
-        frame_samples = int(sample_rate * frame_ms / 1000)
-        if frame_samples < 1:
-            frame_samples = 1
+def amplitude_visemes_for_samples(samples, sample_rate: int = 44100,
+                                  frame_ms: int = 16) -> list:
+    """
+    Same as amplitude_visemes_for_audio, for callers that already hold the
+    chunk as an int16 sample array (see pcm_to_samples).
 
-        visemes = []
-        for i in range(0, len(samples) - frame_samples, frame_samples):
-            window = samples[i:i + frame_samples]
-            rms = float(np.sqrt(np.mean(window ** 2)))  # Convert to native Python float
+    Args:
+        samples: int16 NumPy array of mono samples
+        sample_rate: Audio sample rate (default 44100)
+        frame_ms: Frame interval in ms (16ms ≈ 60fps)
 
-            # Scale RMS to jaw (0-1), with threshold for silence
-            if rms < 0.02:
-                jaw = 0.0
-            else:
-                jaw = min(1.0, (rms - 0.02) * 4.0)
-                jaw = jaw ** 0.7  # Soften curve for more natural movement
+    Returns:
+        List of viseme dicts with t, jaw, smile, funnel, _amplitude marker
+    """
+    if not NUMPY_AVAILABLE or samples is None or not samples.size:
+        return []
 
-            visemes.append({
-                't': round(float(i / sample_rate), 3),  # Ensure native float
-                'jaw': round(float(jaw), 2),  # Ensure native float
-                'smile': 0.0,
-                'funnel': 0.0,
-                '_amplitude': True  # Marker for amplitude-generated
-            })
+    try:
+        frame_samples = int(sample_rate * frame_ms / 1000)
+        if frame_samples < 1:
+            frame_samples = 1
 
-        return visemes
+        # Whole frames only; the trailing partial (or exactly-final) frame is skipped
+        n_frames = (len(samples) - 1) // frame_samples
+        if n_frames < 1:
+            return []
+
+        jaw = None
+        if NUMBA_AVAILABLE and not _rms_kernel_failed:
+            try:
+                jaw = _rms_to_jaw(samples, frame_samples, n_frames)
+            except Exception as e:
+                _disable_rms_kernel(e)
+        if jaw is None:
+            # One (n_frames, frame_samples) view -> RMS per row in a single pass.
+            # Sum of squares is accumulated in int64 directly on the int16 samples
+            # (no float copy); normalization to -1..1 is applied once per frame.
+            frames = samples[:n_frames * frame_samples].reshape(n_frames, frame_samples)
+            sqsum = np.einsum('ij,ij->i', frames, frames, dtype=np.int64)
+            rms = np.sqrt(sqsum / frame_samples) * (1.0 / 32768.0)
+
+            # Scale RMS to jaw (0-1), with threshold for silence: clipping at 0
+            # maps everything below the threshold to a closed jaw, no masking needed.
+            # Curve softened with ** 0.7 for more natural movement
+            jaw = np.clip((rms - 0.02) * 4.0, 0.0, 1.0) ** 0.7
+        # .tolist() yields native Python floats (JSON-safe, no numpy scalars)
+        jaw = np.round(jaw, 2).tolist()
+        times = np.round(np.arange(n_frames) * frame_samples / sample_rate, 3).tolist()
+
+        return [{
+            't': t,
+            'jaw': j,
+            'smile': 0.0,
+            'funnel': 0.0,
+            '_amplitude': True  # Marker for amplitude-generated
+        } for t, j in zip(times, jaw)]
     except Exception as e:
         print(f"[Lipsync] Amplitude analysis error: {e}")
         return []
 
 
 def find_coverage_gaps(word_visemes: list, audio_end: float,
-                       audio_start: float = 0, min_gap_ms: float = 1000) -> list:
+                       audio_start: float = 0, min_gap_ms: float = 1000,
+                       assume_sorted: bool = False) -> list:
     """
     Find time ranges where word visemes don't provide coverage.
 
@@ -249,56 +382,80 @@ def find_coverage_gaps(word_visemes: list, audio_end: float,
         audio_start: Start time of audio segment (base_time for this chunk)
         min_gap_ms: Minimum gap size to consider (default 1000ms = 1s)
                     Only fills significant gaps like [laughs], [sighs], not word spacing
+        assume_sorted: Skip sorting when word_visemes is already in time order
 
     Returns:
         List of (start, end) tuples representing gaps
     """
-    print(f"[Lipsync] find_coverage_gaps: audio_start={audio_start:.3f}s, audio_end={audio_end:.3f}s, min_gap={min_gap_ms}ms")
+    if LIPSYNC_DEBUG:
+        print(f"[Lipsync] find_coverage_gaps: audio_start={audio_start:.3f}s, audio_end={audio_end:.3f}s, min_gap={min_gap_ms}ms")
 
     if not word_visemes:
-        print(f"[Lipsync]   No word visemes - entire audio is a gap")
+        if LIPSYNC_DEBUG:
+            print(f"[Lipsync]   No word visemes - entire audio is a gap")
         return [(audio_start, audio_end)] if audio_end > audio_start else []
 
     gaps = []
     min_gap = min_gap_ms / 1000
     buffer = 0.05  # 50ms buffer around word visemes
 
-    # Sort by time
-    sorted_visemes = sorted(word_visemes, key=lambda v: v.get('t', 0))
+    # Sorted timestamps (frames without 't' count as 0, as before)
+    times = [v.get('t', 0) for v in word_visemes]
+    if not assume_sorted:
+        times.sort()
 
-    first_t = sorted_visemes[0].get('t', 0)
-    last_t = sorted_visemes[-1].get('t', 0)
-    print(f"[Lipsync]   Word viseme range: {first_t:.3f}s - {last_t:.3f}s ({len(sorted_visemes)} visemes)")
+    first_t = times[0]
+    last_t = times[-1]
+    if LIPSYNC_DEBUG:
+        print(f"[Lipsync]   Word viseme range: {first_t:.3f}s - {last_t:.3f}s ({len(times)} visemes)")
 
     # Gap before first viseme (but not before audio_start)
     if first_t - audio_start > min_gap:
         gap = (audio_start, first_t - buffer)
         gaps.append(gap)
-        print(f"[Lipsync]   Gap before first word: {gap[0]:.3f}s - {gap[1]:.3f}s ({(gap[1]-gap[0])*1000:.0f}ms)")
-
-    # Gaps between visemes
-    for i in range(len(sorted_visemes) - 1):
-        curr_t = sorted_visemes[i].get('t', 0)
-        next_t = sorted_visemes[i + 1].get('t', 0)
-        gap_size = next_t - curr_t
+        if LIPSYNC_DEBUG:
+            print(f"[Lipsync]   Gap before first word: {gap[0]:.3f}s - {gap[1]:.3f}s ({(gap[1]-gap[0])*1000:.0f}ms)")
 
-        if gap_size > min_gap:
-            gap = (curr_t + buffer, next_t - buffer)
-            gaps.append(gap)
-            print(f"[Lipsync]   Gap between visemes: {gap[0]:.3f}s - {gap[1]:.3f}s ({(gap[1]-gap[0])*1000:.0f}ms)")
+    # Gaps between visemes (vectorized when numpy is available)
+    if NUMPY_AVAILABLE:
+        t = np.asarray(times, dtype=np.float64)
+        gap_mask = np.diff(t) > min_gap
+        between = list(zip((t[:-1][gap_mask] + buffer).tolist(),
+                           (t[1:][gap_mask] - buffer).tolist()))
+    else:
+        between = [(curr_t + buffer, next_t - buffer)
+                   for curr_t, next_t in zip(times, times[1:])
+                   if next_t - curr_t > min_gap]
+    if between:
+        gaps.extend(between)
+        if LIPSYNC_DEBUG:
+            for gap in between:
+                print(f"[Lipsync]   Gap between visemes: {gap[0]:.3f}s - {gap[1]:.3f}s ({(gap[1]-gap[0])*1000:.0f}ms)")
 
     # Gap after last viseme
     if audio_end - last_t > min_gap:
         gap = (last_t + buffer, audio_end)
         gaps.append(gap)
-        print(f"[Lipsync]   Gap after last word: {gap[0]:.3f}s - {gap[1]:.3f}s ({(gap[1]-gap[0])*1000:.0f}ms)")
+        if LIPSYNC_DEBUG:
+            print(f"[Lipsync]   Gap after last word: {gap[0]:.3f}s - {gap[1]:.3f}s ({(gap[1]-gap[0])*1000:.0f}ms)")
 
-    if not gaps:
+    if not gaps and LIPSYNC_DEBUG:
         print(f"[Lipsync]   No gaps >= {min_gap_ms}ms found")
 
     return gaps
 
 
+def _times_overlap(sorted_times, times):
+    """Boolean mask of times matching (to the ms) an entry of sorted_times."""
+    times = np.asarray(times, dtype=np.float64)
+    if not len(sorted_times):
+        return np.zeros(times.shape, dtype=bool)
+    idx = np.searchsorted(sorted_times, times)
+    right = sorted_times[np.minimum(idx, len(sorted_times) - 1)]
+    left = sorted_times[np.maximum(idx - 1, 0)]
+    return (np.abs(right - times) < 1e-4) | (np.abs(left - times) < 1e-4)
+
+
 def fill_gaps_with_amplitude(word_visemes: list, amplitude_visemes: list,
                               gaps: list, burst_type: str = None) -> list:
     """
@@ -309,6 +466,9 @@ def fill_gaps_with_amplitude(word_visemes: list, amplitude_visemes: list,
     Amplitude visemes are placed STRICTLY within gaps - no overlap.
     Each gap starts and ends with closed mouth (jaw=0).
 
+    Viseme dicts are not copied: the result references the input dicts,
+    so callers that mutate it must own both input lists.
+
     Args:
         word_visemes: Original word-based visemes (preserved exactly)
         amplitude_visemes: Amplitude-generated visemes for gap filling
@@ -319,26 +479,39 @@ def fill_gaps_with_amplitude(word_visemes: list, amplitude_visemes: list,
         Combined list sorted by time
     """
     if not amplitude_visemes or not gaps:
-        print(f"[Lipsync] Gap-fill skipped: no amplitude visemes or no gaps")
+        if LIPSYNC_DEBUG:
+            print(f"[Lipsync] Gap-fill skipped: no amplitude visemes or no gaps")
         return word_visemes
 
-    # Start with word visemes (preserved exactly)
-    result = [v.copy() for v in word_visemes]
-
-    # Get word viseme timestamps for overlap checking
-    word_times = set()
-    for v in word_visemes:
-        word_times.add(round(v.get('t', 0), 3))
-
-    print(f"[Lipsync] Gap-fill for burst '{burst_type}': {len(gaps)} gap(s), {len(word_visemes)} word visemes")
+    # Frames added inside gaps (word visemes are preserved exactly)
+    gap_frames = []
+
+    # Sorted word viseme timestamps (ms precision) for overlap checking
+    word_times = np.fromiter((v['t'] for v in word_visemes),
+                             dtype=np.float64, count=len(word_visemes))
+    words_sorted = bool(np.all(word_times[1:] >= word_times[:-1]))
+    word_times = np.round(word_times, 3)
+    if not words_sorted:
+        word_times.sort()
+
+    # Amplitude times/jaw as arrays for vectorized gap membership.
+    # Candidates must have amplitude and not overlap any word viseme.
+    count = len(amplitude_visemes)
+    amp_t = np.fromiter((v['t'] for v in amplitude_visemes), dtype=np.float64, count=count)
+    amp_jaw = np.fromiter((v['jaw'] for v in amplitude_visemes), dtype=np.float64, count=count)
+    candidates = (amp_jaw > 0.1) & ~_times_overlap(word_times, np.round(amp_t, 3))
+    # Amplitude visemes are generated in time order, so each gap is a slice
+    amp_sorted = bool(np.all(amp_t[1:] >= amp_t[:-1]))
 
     for gap_idx, (gap_start, gap_end) in enumerate(gaps):
         if gap_end <= gap_start:
-            print(f"[Lipsync]   Gap {gap_idx}: invalid (end <= start), skipping")
+            if LIPSYNC_DEBUG:
+                print(f"[Lipsync]   Gap {gap_idx}: invalid (end <= start), skipping")
             continue
 
-        gap_duration = gap_end - gap_start
-        print(f"[Lipsync]   Gap {gap_idx}: {gap_start:.3f}s - {gap_end:.3f}s ({gap_duration:.3f}s)")
+        if LIPSYNC_DEBUG:
+            gap_duration = gap_end - gap_start
+            print(f"[Lipsync]   Gap {gap_idx}: {gap_start:.3f}s - {gap_end:.3f}s ({gap_duration:.3f}s)")
 
         # Add opening closure frame at gap start
         opening_frame = {
@@ -350,10 +523,11 @@ def fill_gaps_with_amplitude(word_visemes: list, amplitude_visemes: list,
         }
 
         # Check no overlap with word visemes
-        if round(gap_start, 3) not in word_times:
-            result.append(opening_frame)
-            print(f"[Lipsync]     Added opening closure at {gap_start:.3f}s")
-        else:
+        if not _times_overlap(word_times, opening_frame['t']):
+            gap_frames.append(opening_frame)
+            if LIPSYNC_DEBUG:
+                print(f"[Lipsync]     Added opening closure at {gap_start:.3f}s")
+        elif LIPSYNC_DEBUG:
             print(f"[Lipsync]     Opening closure skipped - overlaps word viseme at {gap_start:.3f}s")
 
         # Find amplitude visemes STRICTLY within this gap (with margin)
@@ -361,17 +535,18 @@ def fill_gaps_with_amplitude(word_visemes: list, amplitude_visemes: list,
         inner_start = gap_start + margin
         inner_end = gap_end - margin
 
-        gap_visemes = []
-        for v in amplitude_visemes:
-            t = v.get('t', 0)
-            # Strictly within gap (not at edges) and has amplitude
-            if inner_start < t < inner_end and v.get('jaw', 0) > 0.1:
-                # Double-check no overlap with word visemes
-                if round(t, 3) not in word_times:
-                    gap_visemes.append(v.copy())
+        # Strictly within gap (not at edges), has amplitude, no word overlap
+        if amp_sorted:
+            lo = int(np.searchsorted(amp_t, inner_start, side='right'))
+            hi = int(np.searchsorted(amp_t, inner_end, side='left'))
+            in_gap = lo + np.flatnonzero(candidates[lo:hi])
+        else:
+            in_gap = np.flatnonzero(candidates & (amp_t > inner_start) & (amp_t < inner_end))
+        gap_visemes = [amplitude_visemes[i] for i in in_gap.tolist()]
 
-        print(f"[Lipsync]     Found {len(gap_visemes)} amplitude visemes in gap interior")
-        result.extend(gap_visemes)
+        if LIPSYNC_DEBUG:
+            print(f"[Lipsync]     Found {len(gap_visemes)} amplitude visemes in gap interior")
+        gap_frames.extend(gap_visemes)
 
         # Add closing closure frame at gap end
         closing_frame = {
@@ -382,14 +557,26 @@ def fill_gaps_with_amplitude(word_visemes: list, amplitude_visemes: list,
             '_amplitude': True
         }
 
-        if round(gap_end, 3) not in word_times:
-            result.append(closing_frame)
-            print(f"[Lipsync]     Added closing closure at {gap_end:.3f}s")
-        else:
+        if not _times_overlap(word_times, closing_frame['t']):
+            gap_frames.append(closing_frame)
+            if LIPSYNC_DEBUG:
+                print(f"[Lipsync]     Added closing closure at {gap_end:.3f}s")
+        elif LIPSYNC_DEBUG:
             print(f"[Lipsync]     Closing closure skipped - overlaps word viseme at {gap_end:.3f}s")
 
-    # Sort by time
-    result.sort(key=lambda v: v.get('t', 0))
+    if LIPSYNC_DEBUG:
+        print(f"[Lipsync] Gap-fill for burst '{burst_type}': {len(gaps)} gap(s), "
+              f"{len(word_visemes)} word visemes, {len(gap_frames)} amplitude frames added")
+
+    # Both lists are normally already in time order (gaps come sorted from
+    # find_coverage_gaps), so a linear merge replaces the full sort
+    by_time = itemgetter('t')
+    gap_t = [v['t'] for v in gap_frames]
+    if words_sorted and all(x <= y for x, y in zip(gap_t, gap_t[1:])):
+        return list(heapq.merge(word_visemes, gap_frames, key=by_time))
+
+    result = word_visemes + gap_frames
+    result.sort(key=by_time)
     return result
 
 
@@ -406,14 +593,9 @@ def detect_audio_burst_tag(text: str) -> str | None:
     if not text:
         return None
 
-    matches = re.findall(r'\[(\w+)\]', text.lower())
-    for tag in matches:
-        if tag in AUDIO_BURST_TAGS:
-            # Return base form for modifier lookup
-            for base in BURST_MODIFIERS:
-                if tag == base or tag.startswith(base):
-                    return base
-    return None
+    # Named group of the first whitelisted tag is its base form
+    match = _BURST_RE.search(text)
+    return match.lastgroup if match else None
 
 
 def apply_burst_modifiers(visemes: list, burst_type: str) -> list:
@@ -434,42 +616,110 @@ def apply_burst_modifiers(visemes: list, burst_type: str) -> list:
 
     mods = BURST_MODIFIERS[burst_type]
 
-    for v in visemes:
-        # Only modify amplitude-generated visemes
-        if v.get('_amplitude') and v.get('jaw', 0) > 0.05:
-            intensity = float(v['jaw'])  # Ensure native float
-            v['smile'] = round(float(mods.get('smile', 0) * intensity), 2)
-            v['funnel'] = round(float(mods.get('funnel', 0) * intensity), 2)
+    # Only modify amplitude-generated visemes
+    targets = [v for v in visemes if v.get('_amplitude') and v['jaw'] > 0.05]
+    if not targets:
+        return visemes
+
+    # Scale by jaw intensity in one vectorized pass (.tolist() -> native floats)
+    intensity = np.fromiter((v['jaw'] for v in targets), dtype=np.float64, count=len(targets))
+    smiles = np.round(mods.get('smile', 0) * intensity, 2).tolist()
+    funnels = np.round(mods.get('funnel', 0) * intensity, 2).tolist()
+
+    for v, smile, funnel in zip(targets, smiles, funnels):
+        v['smile'] = smile
+        v['funnel'] = funnel
 
     return visemes
 
 
+# Phoneme cache: (word_lower, lang) -> tuple of IPA phonemes (bounded LRU)
+PHONEME_CACHE_SIZE = 8192
+_PHONEME_CACHE = OrderedDict()
+_PHONEME_CACHE_LOCK = threading.Lock()  # TTS threads share the cache (get + move_to_end / evict)
+
+
+def _cache_phonemes(key, phonemes):
+    """Store phonemes for a (word_lower, lang) key, evicting the oldest entry."""
+    with _PHONEME_CACHE_LOCK:
+        _PHONEME_CACHE[key] = phonemes
+        if len(_PHONEME_CACHE) > PHONEME_CACHE_SIZE:
+            _PHONEME_CACHE.popitem(last=False)
+
+
 def word_to_phonemes(word, lang=None):
     """Convert a word to list of IPA phonemes using Gruut."""
     if not GRUUT_AVAILABLE:
         return []
 
     lang = lang or get_language()
+    key = (word.lower(), lang)
+
+    with _PHONEME_CACHE_LOCK:
+        cached = _PHONEME_CACHE.get(key)
+        if cached is not None:
+            _PHONEME_CACHE.move_to_end(key)
+    if cached is not None:
+        return list(cached)
 
     try:
+        # Only the cache key is lowercased: Gruut gets the original casing (acronyms, names)
         for sent in sentences(word, lang=lang):
             for w in sent:
                 if w.phonemes:
-                    return list(w.phonemes)
+                    phonemes = tuple(w.phonemes)
+                    _cache_phonemes(key, phonemes)
+                    return list(phonemes)
+        _cache_phonemes(key, ())
     except Exception as e:
         print(f"[Lipsync] Gruut error for '{word}': {e}")
 
     return []
 
 
-def phoneme_to_viseme(phoneme):
-    """Map IPA phoneme to viseme blendshape values."""
-    # Try exact match first
-    if phoneme in VISEME_MAP:
-        return VISEME_MAP[phoneme]
+def prefetch_phonemes(words, lang):
+    """
+    Phonemize all uncached words of an utterance with a single Gruut call.
+
+    Only plain words (letters/apostrophes, surrounding punctuation ignored)
+    are batched. If Gruut's tokenization doesn't line up 1:1 with the input
+    the batch is discarded and word_to_phonemes falls back to per-word calls.
+    """
+    if not GRUUT_AVAILABLE:
+        return
+
+    pending = {}
+    for word in words:
+        key = (word.lower(), lang)
+        if key in _PHONEME_CACHE or key in pending:
+            continue
+        core = word.strip(string.punctuation)
+        if core and core.replace("'", "").isalpha():
+            pending[key] = core
+
+    if len(pending) < 2:
+        return
+
+    try:
+        found = [tuple(w.phonemes)
+                 for sent in sentences(' '.join(pending.values()), lang=lang)
+                 for w in sent
+                 if w.phonemes and not getattr(w, 'is_break', False)]
+    except Exception as e:
+        print(f"[Lipsync] Gruut batch error: {e}")
+        return
+
+    if len(found) != len(pending):
+        return
 
+    for key, phonemes in zip(pending, found):
+        _cache_phonemes(key, phonemes)
+
+
+def _resolve_viseme(phoneme):
+    """Resolve a phoneme not found directly in VISEME_MAP."""
     # Strip stress markers (ˈ ˌ) and digits
-    clean = ''.join(c for c in phoneme if c not in 'ˈˌ' and not c.isdigit())
+    clean = phoneme.translate(STRIP_TABLE)
     if clean in VISEME_MAP:
         return VISEME_MAP[clean]
 
@@ -480,6 +730,42 @@ def phoneme_to_viseme(phoneme):
     return DEFAULT_VISEME
 
 
+def phoneme_to_viseme(phoneme):
+    """Map IPA phoneme to viseme blendshape values."""
+    viseme = _VISEME_LOOKUP.get(phoneme)
+    if viseme is None:
+        viseme = _VISEME_LOOKUP[phoneme] = _resolve_viseme(phoneme)
+    return viseme
+
+
+# (word_lower, lang) -> relative frames; only non-empty results are stored so a
+# transient Gruut failure is retried on the next occurrence of the word
+RELATIVE_FRAMES_CACHE_SIZE = 4096
+_RELATIVE_FRAMES_CACHE = OrderedDict()
+_RELATIVE_FRAMES_LOCK = threading.Lock()
+
+
+def _relative_frames(word, lang):
+    """Per-phoneme (fraction of word duration, viseme) pairs for a word."""
+    key = (word.lower(), lang)
+    with _RELATIVE_FRAMES_LOCK:
+        cached = _RELATIVE_FRAMES_CACHE.get(key)
+        if cached is not None:
+            _RELATIVE_FRAMES_CACHE.move_to_end(key)
+            return cached
+
+    phonemes = word_to_phonemes(word, lang)
+    if not phonemes:
+        return ()
+    count = len(phonemes)
+    relative = tuple((i / count, phoneme_to_viseme(p)) for i, p in enumerate(phonemes))
+    with _RELATIVE_FRAMES_LOCK:
+        _RELATIVE_FRAMES_CACHE[key] = relative
+        if len(_RELATIVE_FRAMES_CACHE) > RELATIVE_FRAMES_CACHE_SIZE:
+            _RELATIVE_FRAMES_CACHE.popitem(last=False)
+    return relative
+
+
 def process_word_timing(word, start_ms, end_ms, lang=None):
     """
     Convert a word with timing into viseme frames.
@@ -487,9 +773,9 @@ def process_word_timing(word, start_ms, end_ms, lang=None):
     Returns list of (time_sec, viseme_dict, word) tuples.
     The word is included for debugging purposes.
     """
-    phonemes = word_to_phonemes(word, lang)
+    relative = _relative_frames(word, lang or get_language()) if GRUUT_AVAILABLE else ()
 
-    if not phonemes:
+    if not relative:
         # Fallback: simple open/close for unknown words
         mid_time = (start_ms + end_ms) / 2 / 1000.0
         return [
@@ -498,16 +784,10 @@ def process_word_timing(word, start_ms, end_ms, lang=None):
             (end_ms / 1000.0, REST_VISEME, word),
         ]
 
-    duration_ms = end_ms - start_ms
-    phoneme_duration = duration_ms / len(phonemes)
-
-    frames = []
-    for i, phoneme in enumerate(phonemes):
-        t = start_ms + (i * phoneme_duration)
-        viseme = phoneme_to_viseme(phoneme)
-        frames.append((t / 1000.0, viseme, word))
-
-    return frames
+    # Shift the cached relative sequence onto this word's timing
+    start = start_ms / 1000.0
+    duration = (end_ms - start_ms) / 1000.0
+    return [(start + fraction * duration, viseme, word) for fraction, viseme in relative]
 
 
 # ============================================
@@ -517,18 +797,16 @@ def process_word_timing(word, start_ms, end_ms, lang=None):
 def send_visemes(frames):
     """Send viseme frames via socket.
 
-    Frames can be 2-tuple (t, viseme) or 3-tuple (t, viseme, word).
-    Word info is stripped before sending to Lua.
+    Frames can be viseme dicts (t, jaw, smile, funnel), 2-tuples (t, viseme)
+    or 3-tuples (t, viseme, word). Word info is stripped before sending to Lua.
     """
     if not _lua_socket:
         print("[Lipsync] No socket - frames dropped")
         return
-    # Handle both 2-tuple and 3-tuple frames (word is optional third element)
-    socket_frames = []
-    for frame in frames:
-        t = frame[0]
-        v = frame[1]
-        socket_frames.append([t, v.get("jaw", 0), v.get("smile", 0), v.get("funnel", 0)])
+    # Visemes always carry jaw/smile/funnel, so subscript directly
+    socket_frames = [[f["t"], f["jaw"], f["smile"], f["funnel"]] if isinstance(f, dict)
+                     else [f[0], f[1]["jaw"], f[1]["smile"], f[1]["funnel"]]
+                     for f in frames]
     _lua_socket.send_visemes(socket_frames)
     print(f"[Lipsync] Sent {len(socket_frames)} frames via socket")
 
@@ -565,6 +843,11 @@ def process_word_alignment(word_alignment, lang=None, auto_send=True,
     Returns:
         List of viseme dicts: [{t, jaw, smile, funnel}, ...]
     """
+    # Gap-fill disabled (or no numpy): drop the audio up front so none of the
+    # burst detection / amplitude analysis below runs
+    if not (AMPLITUDE_GAP_FILL_ENABLED and NUMPY_AVAILABLE):
+        pcm_data = None
+
     # Handle empty/missing word alignment
     if not word_alignment or isinstance(word_alignment, str):
         words = []
@@ -575,8 +858,18 @@ def process_word_alignment(word_alignment, lang=None, auto_send=True,
         starts = word_alignment.get("wordStartTimeSeconds", [])
         ends = word_alignment.get("wordEndTimeSeconds", [])
 
+    # Nothing to animate: no words and no audio to gap-fill from
+    if not words and not pcm_data:
+        return []
+
     print(f"[Lipsync] Processing {len(words)} words")
 
+    # Resolve language once per utterance rather than once per word,
+    # then phonemize the whole utterance in one Gruut call
+    if words and GRUUT_AVAILABLE:
+        lang = lang or get_language()
+        prefetch_phonemes(words, lang)
+
     all_frames = []
     for i, word in enumerate(words):
         if word.strip():
@@ -587,54 +880,65 @@ def process_word_alignment(word_alignment, lang=None, auto_send=True,
     # Convert to normalized format: [{t, jaw, smile, funnel}, ...]
     # NOTE: Inworld word times are ABSOLUTE from utterance start, NOT chunk-relative
     # So we do NOT add base_time here - that's only for amplitude visemes
-    word_visemes = []
-    for frame in all_frames:
-        t = frame[0]  # Already absolute - don't add base_time!
-        v = frame[1]
-        word_visemes.append({
-            "t": t,
-            "jaw": v.get("jaw", 0),
-            "smile": v.get("smile", 0),
-            "funnel": v.get("funnel", 0)
-        })
+    # frame[0] is already absolute - don't add base_time!
+    word_visemes = [{
+        "t": t,
+        "jaw": v["jaw"],
+        "smile": v["smile"],
+        "funnel": v["funnel"]
+    } for t, v, _word in all_frames]
 
     # Gap filling with amplitude visemes - ONLY when burst tags detected
     gap_filled = False
     amplitude_count = 0
 
     # First check for burst tags - only gap-fill if we find one
-    burst = detect_audio_burst_tag(text) if text else None
+    burst = detect_audio_burst_tag(text) if text and pcm_data else None
 
-    if burst and pcm_data and NUMPY_AVAILABLE and AMPLITUDE_GAP_FILL_ENABLED:
+    if burst:
         print(f"[Lipsync] Burst tag detected: '{burst}' - enabling amplitude gap-fill")
 
         # Calculate audio duration for this chunk
-        chunk_duration = len(pcm_data) / 2 / sample_rate  # 16-bit = 2 bytes/sample
+        samples = pcm_to_samples(pcm_data)
+        chunk_duration = samples.size / sample_rate
         audio_end = base_time + chunk_duration
-        print(f"[Lipsync] Chunk: base_time={base_time:.3f}s, duration={chunk_duration:.3f}s, end={audio_end:.3f}s")
+        if LIPSYNC_DEBUG:
+            print(f"[Lipsync] Chunk: base_time={base_time:.3f}s, duration={chunk_duration:.3f}s, end={audio_end:.3f}s")
 
         # Generate amplitude visemes for entire audio chunk (relative to chunk start)
-        amp_visemes = amplitude_visemes_for_audio(pcm_data, sample_rate)
-        print(f"[Lipsync] Generated {len(amp_visemes)} amplitude visemes from audio")
+        amp_visemes = amplitude_visemes_for_samples(samples, sample_rate)
+        if LIPSYNC_DEBUG:
+            print(f"[Lipsync] Generated {len(amp_visemes)} amplitude visemes from audio")
 
         # Offset amplitude timestamps by base_time (they're chunk-relative, need absolute)
         for v in amp_visemes:
             v['t'] += base_time
 
-        # Filter word visemes to only those within this chunk's time range
-        chunk_word_visemes = [v for v in word_visemes
-                             if base_time <= v.get('t', 0) <= audio_end]
-        print(f"[Lipsync] Word visemes in chunk: {len(chunk_word_visemes)} of {len(word_visemes)} total")
+        # Filter word visemes to only those within this chunk's time range.
+        # Word visemes are emitted in time order, so this is normally a
+        # binary-searched slice; overlapping alignments fall back to a mask.
+        word_t = np.fromiter((v['t'] for v in word_visemes), dtype=np.float64, count=len(word_visemes))
+        words_sorted = bool(np.all(word_t[1:] >= word_t[:-1]))
+        if words_sorted:
+            lo = int(np.searchsorted(word_t, base_time, side='left'))
+            hi = int(np.searchsorted(word_t, audio_end, side='right'))
+            chunk_word_visemes = word_visemes[lo:hi]
+        else:
+            in_chunk = np.flatnonzero((word_t >= base_time) & (word_t <= audio_end))
+            chunk_word_visemes = [word_visemes[i] for i in in_chunk.tolist()]
+        if LIPSYNC_DEBUG:
+            print(f"[Lipsync] Word visemes in chunk: {len(chunk_word_visemes)} of {len(word_visemes)} total")
 
         # Log word viseme timestamps for debugging
-        if chunk_word_visemes:
-            word_times_str = ", ".join([f"{v.get('t', 0):.3f}" for v in chunk_word_visemes[:10]])
+        if LIPSYNC_DEBUG and chunk_word_visemes:
+            word_times_str = ", ".join([f"{v['t']:.3f}" for v in chunk_word_visemes[:10]])
             if len(chunk_word_visemes) > 10:
                 word_times_str += f"... (+{len(chunk_word_visemes) - 10} more)"
             print(f"[Lipsync] Word viseme times: [{word_times_str}]")
 
         # Find gaps in word viseme coverage (within this chunk's time range)
-        gaps = find_coverage_gaps(chunk_word_visemes, audio_end, audio_start=base_time)
+        gaps = find_coverage_gaps(chunk_word_visemes, audio_end, audio_start=base_time,
+                                  assume_sorted=words_sorted)
         print(f"[Lipsync] Found {len(gaps)} gap(s) in coverage")
 
         if gaps:
@@ -643,7 +947,8 @@ def process_word_alignment(word_alignment, lang=None, auto_send=True,
 
             # Apply burst modifiers (smile/funnel based on burst type)
             combined = apply_burst_modifiers(combined, burst)
-            print(f"[Lipsync] Applied '{burst}' modifiers to amplitude visemes")
+            if LIPSYNC_DEBUG:
+                print(f"[Lipsync] Applied '{burst}' modifiers to amplitude visemes")
 
             # Count how many amplitude visemes were added
             amplitude_count = sum(1 for v in combined if v.get('_amplitude'))
@@ -658,54 +963,35 @@ def process_word_alignment(word_alignment, lang=None, auto_send=True,
             word_visemes = combined
         else:
             print(f"[Lipsync] No gaps found for burst '{burst}' - word visemes cover entire audio")
-    elif burst:
-        print(f"[Lipsync] Burst tag '{burst}' detected but gap-fill disabled or no audio data")
-    else:
-        print(f"[Lipsync] No burst tag in text - skipping amplitude gap-fill")
+    elif LIPSYNC_DEBUG:
+        print(f"[Lipsync] No burst tag or audio data - skipping amplitude gap-fill")
 
     # Add smooth mouth closure frames (200ms, 4 steps) AFTER gap filling
     # Only add closure for the FINAL chunk, not intermediate chunks
     if add_closure and word_visemes:
         last_viseme = word_visemes[-1]
-        last_time = last_viseme.get('t', 0)
+        last_time = last_viseme["t"]
+        jaw = last_viseme["jaw"]
+        smile = last_viseme["smile"]
+        funnel = last_viseme["funnel"]
 
         # Check if mouth is already nearly closed
-        max_val = max(last_viseme.get("jaw", 0), last_viseme.get("smile", 0), last_viseme.get("funnel", 0))
-
-        if max_val > 0.05:  # Only add closure if mouth is open
-            closure_steps = 4
-            closure_duration = 0.2  # 200ms total
-            step_duration = closure_duration / closure_steps
-
-            for i in range(1, closure_steps + 1):
-                t = last_time + (i * step_duration)
-                alpha = i / closure_steps  # 0.25, 0.5, 0.75, 1.0
-                # Lerp from last_viseme to REST_VISEME (all zeros)
-                frame = {
-                    "t": t,
-                    "jaw": round(last_viseme.get("jaw", 0) * (1 - alpha), 2),
-                    "smile": round(last_viseme.get("smile", 0) * (1 - alpha), 2),
-                    "funnel": round(last_viseme.get("funnel", 0) * (1 - alpha), 2),
-                }
-                word_visemes.append(frame)
-                # Also add to all_frames for debug output
-                all_frames.append((t - base_time, frame, "[closure]"))
-
-            print(f"[Lipsync] Added {closure_steps} closure frames over {closure_duration*1000:.0f}ms")
-
-    if word_visemes:
-        # Ensure all values are native Python types (not numpy) for JSON serialization
-        for v in word_visemes:
-            v['t'] = float(v.get('t', 0))
-            v['jaw'] = float(v.get('jaw', 0))
-            v['smile'] = float(v.get('smile', 0))
-            v['funnel'] = float(v.get('funnel', 0))
-
-        # Legacy behavior: auto-send to Lua
-        if auto_send:
-            # Convert back to tuple format for send_visemes
-            tuple_frames = [(v['t'], v, "[gap-fill]" if v.get('_amplitude') else "?") for v in word_visemes]
-            send_visemes(tuple_frames)
+        if max(jaw, smile, funnel) > 0.05:  # Only add closure if mouth is open
+            # Lerp from last_viseme to REST_VISEME (all zeros) over the precomputed ramp
+            word_visemes.extend({
+                "t": last_time + offset,
+                "jaw": round(jaw * remaining, 2),
+                "smile": round(smile * remaining, 2),
+                "funnel": round(funnel * remaining, 2),
+            } for offset, remaining in CLOSURE_RAMP)
+
+            print(f"[Lipsync] Added {CLOSURE_STEPS} closure frames over {CLOSURE_DURATION*1000:.0f}ms")
+
+    # All values are already native Python types (numpy results are converted
+    # with .tolist() where they are produced), so no JSON cleanup pass is needed
+    # Legacy behavior: auto-send to Lua (dicts go straight to send_visemes)
+    if word_visemes and auto_send:
+        send_visemes(word_visemes)
 
     return word_visemes
 
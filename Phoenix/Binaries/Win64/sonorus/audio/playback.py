@@ -12,12 +12,37 @@ import os
 import sys
 import time
 import threading
+from collections import OrderedDict, deque
 from typing import List, Dict, Optional, Callable
 
 # Add parent to path for utils imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.settings import load_settings
+from utils.settings import load_settings_cached
+
+
+def format_visemes(visemes: List[Dict]) -> List[List]:
+    """Format visemes for socket transmission: [t, jaw, smile, funnel]"""
+    # Fast path: lipsync always produces complete viseme dicts, so the fixed
+    # schema is subscripted directly (no .get defaults, no isinstance dispatch)
+    try:
+        return [[v['t'], v['jaw'], v['smile'], v['funnel']] for v in visemes]
+    except (KeyError, TypeError):
+        pass
+
+    # Mixed/partial input: fill missing fields, accept pre-formatted lists
+    formatted = []
+    for v in visemes:
+        if isinstance(v, dict):
+            formatted.append([
+                v.get('t', 0),
+                v.get('jaw', 0),
+                v.get('smile', 0),
+                v.get('funnel', 0)
+            ])
+        elif isinstance(v, (list, tuple)) and len(v) >= 4:
+            formatted.append(list(v[:4]))
+    return formatted
 
 
 class TurnState:
@@ -27,25 +52,31 @@ class TurnState:
         self.turn_id = turn_id
         self.speaker_id = speaker_id         # Character ID for Lua
         self.use_3d = use_3d                 # False for player voice (centered stereo)
-        self.viseme_buffer: List[Dict] = []  # Accumulated visemes
+        self.viseme_buffer: List[List] = []  # Accumulated visemes, already in wire form [t, jaw, smile, funnel]
         self.visemes_sent_idx: int = 0       # How many sent to Lua
+        self.visemes_available = threading.Event()  # Set when visemes are added (wakes sync loop)
         self.audio_stream = None             # TTSStream reference
         self.playback_started: bool = False
-        self.playback_start_time: float = 0  # Wall clock time when audio started
+        self.playback_start_mono: float = 0  # time.monotonic() when audio started
         self.audio_position: float = 0.0     # Current playback position (seconds)
         self.created_at: float = time.time()
 
     def add_visemes(self, visemes: List[Dict]):
-        """Add visemes to buffer (called as TTS chunks arrive)."""
-        self.viseme_buffer.extend(visemes)
+        """Add visemes to buffer (called as TTS chunks arrive).
 
-    def get_unsent_visemes(self) -> List[Dict]:
-        """Get visemes that haven't been sent to Lua yet."""
-        unsent = self.viseme_buffer[self.visemes_sent_idx:]
-        self.visemes_sent_idx = len(self.viseme_buffer)
-        return unsent
+        Visemes are converted to wire frames here, once, so sending is just a slice.
+        """
+        self.viseme_buffer.extend(format_visemes(visemes))
+        self.visemes_available.set()
 
-    def get_all_visemes(self) -> List[Dict]:
+    def take_unsent_range(self) -> tuple:
+        """Mark unsent visemes as sent and return their (lo, hi) index range in viseme_buffer."""
+        lo = self.visemes_sent_idx
+        hi = len(self.viseme_buffer)
+        self.visemes_sent_idx = hi
+        return lo, hi
+
+    def get_all_visemes(self) -> List[List]:
         """Get all visemes (for initial send with lipsync_start)."""
         self.visemes_sent_idx = len(self.viseme_buffer)
         return list(self.viseme_buffer)
@@ -69,7 +100,7 @@ class PlaybackCoordinator:
 
     def __init__(self, lua_socket):
         self.lua_socket = lua_socket
-        self.turns: Dict[str, TurnState] = {}
+        self.turns: "OrderedDict[str, TurnState]" = OrderedDict()  # Oldest first
         self.current_turn_id: Optional[str] = None
 
         # Handshake synchronization
@@ -81,6 +112,12 @@ class PlaybackCoordinator:
         self._sync_thread: Optional[threading.Thread] = None
         self._stop_sync = threading.Event()
 
+        # Socket writer: the sync loop only queues messages, this thread sends them
+        # (so encode + TCP write latency never stretches the sync tick). Each turn
+        # gets its own queue and events, so a writer that outlives its join
+        # timeout can never be revived by, or share a queue with, the next turn.
+        self._writer_thread: Optional[threading.Thread] = None
+
         # Audio position callback (set by audio player)
         self._get_audio_position: Optional[Callable[[], float]] = None
 
@@ -88,10 +125,10 @@ class PlaybackCoordinator:
         """Create a new turn for pre-buffering."""
         turn = TurnState(turn_id, speaker_id, use_3d=use_3d)
         self.turns[turn_id] = turn
+        self.turns.move_to_end(turn_id)  # Re-created turn counts as newest
         # Cleanup old turns (keep last 5)
         if len(self.turns) > 5:
-            oldest = sorted(self.turns.values(), key=lambda t: t.created_at)[0]
-            del self.turns[oldest.turn_id]
+            self.turns.popitem(last=False)
         return turn
 
     def get_turn(self, turn_id: str) -> Optional[TurnState]:
@@ -143,8 +180,7 @@ class PlaybackCoordinator:
                 self.lua_socket.wait_for_turn_complete(timeout=1.0)
 
                 # 3. Look up per-character lipsync scale
-                settings = load_settings()
-                lipsync_settings = settings.get('lipsync', {})
+                lipsync_settings = load_settings_cached().get('lipsync', {})
                 npc_scales = lipsync_settings.get('npc_scales', {})
                 default_scale = lipsync_settings.get('default_scale', 1.0)
                 scale = npc_scales.get(turn.speaker_id, default_scale)
@@ -155,7 +191,7 @@ class PlaybackCoordinator:
                 self.lua_socket.send_lipsync_start(
                     speaker=turn.speaker_id,
                     turn_id=turn_id,
-                    visemes=self._format_visemes(initial_visemes),
+                    visemes=initial_visemes,
                     scale=scale
                 )
 
@@ -171,14 +207,22 @@ class PlaybackCoordinator:
 
                 # 4. Mark playback started (store in turn for sync loop access)
                 turn.playback_started = True
-                turn.playback_start_time = time.time()
-                playback_start_time = turn.playback_start_time
-
-                # 5. Start sync loop (sends new visemes + audio position)
+                turn.playback_start_mono = time.monotonic()
+
+                # 5. Start sync loop (queues new visemes + audio position) and its writer
+                out_q = deque()
+                out_ready = threading.Event()
+                stop_writer = threading.Event()
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop,
+                    args=(out_q, out_ready, stop_writer),
+                    daemon=True
+                )
+                self._writer_thread.start()
                 self._stop_sync.clear()
                 self._sync_thread = threading.Thread(
                     target=self._sync_loop,
-                    args=(turn,),
+                    args=(turn, out_q, out_ready),
                     daemon=True
                 )
                 self._sync_thread.start()
@@ -187,12 +231,17 @@ class PlaybackCoordinator:
                 print(f"[Coordinator] Starting audio playback for turn {turn_id}")
                 success = audio_player.play_stream(turn.audio_stream, use_3d=turn.use_3d)
 
-                # 7. Stop sync loop
+                # 7. Stop sync loop, then let the writer flush what it queued
                 self._stop_sync.set()
+                turn.visemes_available.set()  # Wake the sync loop so it sees the stop
                 if self._sync_thread:
                     self._sync_thread.join(timeout=1.0)
+                stop_writer.set()
+                out_ready.set()
+                if self._writer_thread:
+                    self._writer_thread.join(timeout=1.0)
 
-                playback_duration = time.time() - playback_start_time
+                playback_duration = time.monotonic() - turn.playback_start_mono
                 print(f"[Coordinator] Turn {turn_id} complete: {playback_duration:.2f}s, "
                       f"{len(turn.viseme_buffer)} total visemes")
 
@@ -220,68 +269,98 @@ class PlaybackCoordinator:
             if turn:
                 turn.add_visemes(visemes)
 
-    def _sync_loop(self, turn: TurnState):
-        """Background loop: sends new visemes and audio position sync."""
-        last_sync_time = 0
-        sync_interval = 0.1  # 100ms between audio_sync messages
+    def _sync_loop(self, turn: TurnState, out_q: deque, out_ready: threading.Event):
+        """Background loop: sends new visemes and audio position sync.
+
+        Both ride in one "sync" message per tick (frames and/or position),
+        handed to _writer_loop so the tick never waits on the socket. The loop
+        only wakes when visemes arrive or a position update is due.
+        """
+        sync_interval_ns = 100_000_000  # 100ms between position updates
+        next_sync_ns = 0
+        get_position = self._resolve_position_source(turn)
+        wake = turn.visemes_available
 
         while not self._stop_sync.is_set():
-            now = time.time()
-
-            # Send any new visemes that arrived during playback
-            new_visemes = turn.get_unsent_visemes()
-            if new_visemes:
-                self.lua_socket.send({
-                    "type": "visemes",
-                    "turn_id": turn.turn_id,
-                    "frames": self._format_visemes(new_visemes)
-                })
-                print(f"[Coordinator] Sent {len(new_visemes)} streaming visemes")
-
-            # Send audio position sync
-            if now - last_sync_time >= sync_interval:
-                audio_pos = self._get_audio_position_safe(turn)
+            # Clear before taking the range: visemes added after this re-set it
+            wake.clear()
+            msg = None
+
+            # Any new visemes that arrived during playback (already wire frames)
+            lo, hi = turn.take_unsent_range()
+            if hi > lo:
+                msg = {"type": "sync", "turn_id": turn.turn_id,
+                       "frames": turn.viseme_buffer[lo:hi]}
+
+            # Audio position sync
+            now = time.monotonic_ns()
+            if now >= next_sync_ns:
+                try:
+                    audio_pos = get_position()
+                except Exception as e:
+                    # Broken callback: fall back to the playback clock for the rest of the turn
+                    print(f"[Coordinator] Audio position callback failed ({e}), using playback clock")
+                    get_position = self._playback_clock(turn)
+                    audio_pos = get_position()
                 if audio_pos is not None:
-                    self.lua_socket.send({
-                        "type": "audio_sync",
-                        "turn_id": turn.turn_id,
-                        "position": audio_pos
-                    })
+                    if msg is None:
+                        msg = {"type": "sync", "turn_id": turn.turn_id}
+                    msg["position"] = audio_pos
                     turn.audio_position = audio_pos
-                last_sync_time = now
-
-            time.sleep(0.02)  # 50Hz check rate
+                next_sync_ns = now + sync_interval_ns
+
+            if msg is not None:
+                out_q.append(msg)
+                out_ready.set()
+
+            # Sleep until new visemes arrive, playback stops, or the next position update is due
+            wake.wait((next_sync_ns - time.monotonic_ns()) / 1e9)
+
+    def _writer_loop(self, out_q: deque, out_ready: threading.Event, stop: threading.Event):
+        """Background loop: sends this turn's queued sync messages, coalescing any backlog into one."""
+        while True:
+            out_ready.wait(0.1)
+            out_ready.clear()
+            if out_q:
+                try:
+                    self.lua_socket.send(self._coalesce_sync(out_q))
+                except Exception as e:
+                    print(f"[Coordinator] Sync send error: {e}")  # Keep sending the rest of the turn
+            elif stop.is_set():
+                return
+
+    @staticmethod
+    def _coalesce_sync(out_q: deque) -> Dict:
+        """Merge all queued sync messages: frames in order, newest position wins."""
+        msg = out_q.popleft()
+        while out_q:
+            nxt = out_q.popleft()
+            if "frames" in nxt:
+                if "frames" in msg:
+                    msg["frames"].extend(nxt["frames"])
+                else:
+                    msg["frames"] = nxt["frames"]
+            if "position" in nxt:
+                msg["position"] = nxt["position"]
+        return msg
 
-    def _get_audio_position_safe(self, turn: TurnState) -> Optional[float]:
-        """Get audio position - uses wall clock since playback start."""
-        # Try callback first (if set by audio player)
+    def _resolve_position_source(self, turn: TurnState) -> Callable[[], Optional[float]]:
+        """Pick the audio position source once per turn: audio player callback if set, else playback clock."""
         if self._get_audio_position:
-            try:
-                return self._get_audio_position()
-            except:
-                pass
-
-        # Primary: Use wall clock time since playback started
-        # This is accurate because playback_start_time is set right before audio.play()
-        if turn.playback_started and turn.playback_start_time > 0:
-            return time.time() - turn.playback_start_time
-
-        return None
-
-    def _format_visemes(self, visemes: List[Dict]) -> List[List]:
-        """Format visemes for socket transmission: [t, jaw, smile, funnel]"""
-        formatted = []
-        for v in visemes:
-            if isinstance(v, dict):
-                formatted.append([
-                    v.get('t', 0),
-                    v.get('jaw', 0),
-                    v.get('smile', 0),
-                    v.get('funnel', 0)
-                ])
-            elif isinstance(v, (list, tuple)) and len(v) >= 4:
-                formatted.append(list(v[:4]))
-        return formatted
+            return self._get_audio_position
+        return self._playback_clock(turn)
+
+    @staticmethod
+    def _playback_clock(turn: TurnState) -> Callable[[], Optional[float]]:
+        """Elapsed (monotonic) time since playback started.
+
+        Accurate because playback_start_mono is set right before audio.play().
+        """
+        if not (turn.playback_started and turn.playback_start_mono > 0):
+            return lambda: None
+        start = turn.playback_start_mono
+        monotonic = time.monotonic
+        return lambda: monotonic() - start
 
 
 # Global coordinator instance (set by server.py)
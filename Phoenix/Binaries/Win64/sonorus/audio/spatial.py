@@ -6,32 +6,137 @@ Supports both file playback and streaming TTS with real-time 3D positioning.
 import os
 import sys
 import time
-import queue
 import threading
 import math
+import ctypes
+from collections import deque
+from itertools import islice
 
 # Add parent to path for utils imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.settings import SONORUS_DIR, load_settings
+from utils.settings import SONORUS_DIR, load_settings_cached
 
 # TESTING: Disable 3D positioning to diagnose lag (plays mono audio at center)
 DISABLE_3D_POSITIONING = False
 
+# Per-chunk TTSStream feed/pull logging and timing capture (for debugging audio hitches)
+# Off by default: console prints on the audio path cause the very underruns they measure
+# Set SONORUS_AUDIO_DEBUG=1 to enable
+TTS_STREAM_DIAGNOSTICS = os.getenv("SONORUS_AUDIO_DEBUG", "") == "1"
+
 # OpenAL imports
 try:
     from openal import (
         oalInit, oalQuit, oalGetListener, oalSetStreamBufferCount,
-        Source, SourceStream, Buffer, WaveFile, AL_PLAYING
+        Source, SourceStream, Buffer, WaveFile, AL_PLAYING, AL_STOPPED,
+        AL_BUFFERS_PROCESSED, alGetSourcei, alSourceQueueBuffers, alSourceUnqueueBuffers
     )
     OPENAL_AVAILABLE = True
 except ImportError:
     OPENAL_AVAILABLE = False
     print("[WARN] PyOpenAL not available")
 
+if OPENAL_AVAILABLE:
+    class BatchedSourceStream(SourceStream):
+        """
+        SourceStream that recycles all processed buffers per update() with a single
+        unqueue and a single queue call, instead of one unqueue+queue pair per buffer.
+        Relies on PyOpenAL 0.7.11a1's StreamBuffer ring (pinned in requirements.txt).
+        """
+
+        def update(self):
+            if self._state != AL_PLAYING:
+                return
+            if self.get_state() == AL_STOPPED:
+                self._continue = False
+            if not self._continue:
+                return SourceStream.update(self)  # Upstream drain path
+
+            processed = ctypes.c_int()
+            alGetSourcei(self.id, AL_BUFFERS_PROCESSED, ctypes.pointer(processed))
+            n = processed.value
+            if n <= 0:
+                return True
+
+            # Processed buffers come back in queue order, starting after the last queued slot
+            stream_buffer = self.buffer
+            count = stream_buffer.count
+            buffer_ids = stream_buffer.buffer_ids
+            first = stream_buffer.last_buffer + 1
+            slots = [(first + i) % count for i in range(n)]
+            alSourceUnqueueBuffers(self.id, n, (ctypes.c_uint * n)(*[buffer_ids[i] for i in slots]))
+
+            refilled = []
+            for slot in slots:
+                if not stream_buffer.fill_buffer(slot):
+                    self._continue = False  # Stream finished
+                    break
+                refilled.append(buffer_ids[slot])
+
+            if refilled:
+                k = len(refilled)
+                alSourceQueueBuffers(self.id, k, (ctypes.c_uint * k)(*refilled))
+                stream_buffer.last_buffer = (first + k - 1) % count
+
+            return self._continue
+
+# Position update thread pacing (50Hz)
+POSITION_UPDATE_INTERVAL = 0.02
+
+# Smallest changes worth pushing to OpenAL (squared, to skip the sqrt): 1cm of
+# position, ~0.25 degrees of listener heading (forward-vector distance)
+POSITION_PUSH_THRESHOLD_SQ = 0.01 ** 2
+ORIENTATION_PUSH_THRESHOLD_SQ = math.radians(0.25) ** 2
+
+# Win32 THREAD_PRIORITY_ABOVE_NORMAL
+THREAD_PRIORITY_ABOVE_NORMAL = 1
+
+
+def _moved(new, last, threshold_sq):
+    """True if the first 3 components of new differ from last by more than sqrt(threshold_sq)."""
+    if new is last:
+        return False  # Same cached tuple: nothing changed
+    if last is None:
+        return True
+    dx = new[0] - last[0]
+    dy = new[1] - last[1]
+    dz = new[2] - last[2]
+    return dx * dx + dy * dy + dz * dz > threshold_sq
+
+
+# Private kernel32 binding with typed prototypes (same approach as input/win32.py):
+# GetCurrentThread's pseudo-handle is pointer-sized, the default int restype truncates it
+if sys.platform == "win32":
+    from ctypes import wintypes
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.GetCurrentThread.argtypes = []
+    _kernel32.GetCurrentThread.restype = wintypes.HANDLE
+    _kernel32.SetThreadPriority.argtypes = [wintypes.HANDLE, ctypes.c_int]
+    _kernel32.SetThreadPriority.restype = wintypes.BOOL
+else:
+    _kernel32 = None
+
+
+def _raise_current_thread_priority():
+    """
+    Bump the calling thread above normal priority so the game doesn't
+    preempt position updates (audible as panning stutter). Windows only;
+    silently does nothing elsewhere or if the call fails.
+    """
+    if _kernel32 is None:
+        return False
+    try:
+        return bool(_kernel32.SetThreadPriority(_kernel32.GetCurrentThread(), THREAD_PRIORITY_ABOVE_NORMAL))
+    except Exception:
+        return False
+
 # ============================================
 # Position Reader - reads from socket with interpolation
 # ============================================
+# UE4 units are cm, OpenAL units are m
+UE_TO_AL_SCALE = 0.01
+
 class PositionReader:
     """
     Reads camera and NPC positions from socket server (updated by Lua via TCP).
@@ -55,6 +160,12 @@ class PositionReader:
         self._last_update_time = 0      # When we received last position
         self._update_interval = 0.1     # Expected interval (100ms default)
         self._initialized = False       # First position flag
+        self._settled = True            # Interpolation has reached curr (nothing to do until new data)
+        self._last_socket_positions = None  # Last position tuple read from socket
+
+        # OpenAL-space vectors, recomputed whenever the positions change
+        self._al_orientation_yaw = None  # Yaw the cached orientation was computed for
+        self._update_al_vectors()
 
     def set_socket(self, lua_socket):
         """Set the socket server reference (for lazy initialization)"""
@@ -71,6 +182,7 @@ class PositionReader:
         self.cam_pos = cam_pos
         self.npc_pos = npc_pos
         self.cam_yaw = cam_yaw
+        self._update_al_vectors()
         self._initialized = True
         self._last_update_time = time.time()
 
@@ -78,23 +190,31 @@ class PositionReader:
         # from overwriting these on the next update() call. Without this, the
         # position briefly jumps to the previous speaker's location.
         if self._lua_socket:
-            with self._lua_socket._context_lock:
-                self._lua_socket._positions = {
-                    "camX": cam_pos[0], "camY": cam_pos[1], "camZ": cam_pos[2],
-                    "camYaw": cam_yaw, "camPitch": 0,
-                    "npcX": npc_pos[0], "npcY": npc_pos[1], "npcZ": npc_pos[2],
-                }
+            self._lua_socket.set_positions({
+                "camX": cam_pos[0], "camY": cam_pos[1], "camZ": cam_pos[2],
+                "camYaw": cam_yaw, "camPitch": 0,
+                "npcX": npc_pos[0], "npcY": npc_pos[1], "npcZ": npc_pos[2],
+            })
 
         print(f"[PositionReader] Initial positions set: npc={npc_pos}, cam={cam_pos}, yaw={cam_yaw}")
 
     def _lerp(self, a, b, t):
-        """Linear interpolate between tuples a and b by factor t (0-1)"""
-        t = max(0.0, min(1.0, t))  # Clamp to [0,1]
-        return tuple(a[i] + (b[i] - a[i]) * t for i in range(len(a)))
+        """Linear interpolate between 3-tuples a and b by factor t (0-1)"""
+        # Clamp to [0,1]
+        if t < 0.0:
+            t = 0.0
+        elif t > 1.0:
+            t = 1.0
+        return (a[0] + (b[0] - a[0]) * t,
+                a[1] + (b[1] - a[1]) * t,
+                a[2] + (b[2] - a[2]) * t)
 
     def _lerp_angle(self, a, b, t):
         """Lerp angle with wraparound handling (e.g., 350 -> 10 goes through 0)"""
-        t = max(0.0, min(1.0, t))
+        if t < 0.0:
+            t = 0.0
+        elif t > 1.0:
+            t = 1.0
         diff = b - a
         # Handle wraparound
         if diff > 180:
@@ -109,21 +229,15 @@ class PositionReader:
             return  # No socket, keep last valid values
 
         try:
-            pos = self._lua_socket.get_positions()
-            if not pos:
+            # Socket swaps in a new tuple per update - same object means nothing new
+            pos = self._lua_socket.get_position_tuple()
+            if pos is self._last_socket_positions:
                 return
+            self._last_socket_positions = pos
 
-            new_cam = (
-                float(pos.get("camX", 0)),
-                float(pos.get("camY", 0)),
-                float(pos.get("camZ", 0))
-            )
-            new_npc = (
-                float(pos.get("npcX", 0)),
-                float(pos.get("npcY", 0)),
-                float(pos.get("npcZ", 0))
-            )
-            new_yaw = float(pos.get("camYaw", 0))
+            cam_x, cam_y, cam_z, new_yaw, npc_x, npc_y, npc_z = pos
+            new_cam = (cam_x, cam_y, cam_z)
+            new_npc = (npc_x, npc_y, npc_z)
 
             # Check if anything actually changed (avoid redundant updates)
             if new_cam == self._curr_cam and new_npc == self._curr_npc and new_yaw == self._curr_yaw:
@@ -139,6 +253,7 @@ class PositionReader:
                 self.cam_pos = new_cam
                 self.npc_pos = new_npc
                 self.cam_yaw = new_yaw
+                self._update_al_vectors()
                 self._initialized = True
             else:
                 # Shift current -> previous
@@ -149,6 +264,7 @@ class PositionReader:
                 self._curr_cam = new_cam
                 self._curr_npc = new_npc
                 self._curr_yaw = new_yaw
+                self._settled = False
 
             # Update timing (clamp to max 200ms to handle gaps gracefully)
             if self._last_update_time > 0:
@@ -160,8 +276,8 @@ class PositionReader:
 
     def interpolate(self):
         """Calculate interpolated positions for this frame (call after update)"""
-        if not self._initialized:
-            return  # Keep defaults
+        if not self._initialized or self._settled:
+            return  # Keep defaults / already at curr
 
         now = time.time()
         elapsed = now - self._last_update_time
@@ -170,60 +286,107 @@ class PositionReader:
         t = elapsed / self._update_interval if self._update_interval > 0 else 1.0
 
         # Clamp to 1.0 - don't extrapolate past current (causes overshoot)
-        t = min(t, 1.0)
+        if t >= 1.0:
+            t = 1.0
+            self._settled = True  # Final step lands on curr; skip until next update
 
         # Interpolate positions
         self.cam_pos = self._lerp(self._prev_cam, self._curr_cam, t)
         self.npc_pos = self._lerp(self._prev_npc, self._curr_npc, t)
         self.cam_yaw = self._lerp_angle(self._prev_yaw, self._curr_yaw, t)
+        self._update_al_vectors()
 
-    def get_listener_position(self):
-        """Get camera position for OpenAL listener"""
-        # Convert UE4 coords to OpenAL (scale down from cm to m)
+    def _update_al_vectors(self):
+        """Convert current UE4 positions/yaw to OpenAL space once per update"""
         # UE4: X=forward, Y=right, Z=up
         # OpenAL: X=right, Y=up, Z=backward
-        scale = 0.01
-        return (
-            self.cam_pos[1] * scale,   # UE4 Y (right) -> OpenAL X (right)
-            self.cam_pos[2] * scale,   # UE4 Z (up) -> OpenAL Y (up)
-            -self.cam_pos[0] * scale   # UE4 X (forward) -> OpenAL -Z (forward)
+        cam = self.cam_pos
+        npc = self.npc_pos
+        self._al_listener_pos = (
+            cam[1] * UE_TO_AL_SCALE,   # UE4 Y (right) -> OpenAL X (right)
+            cam[2] * UE_TO_AL_SCALE,   # UE4 Z (up) -> OpenAL Y (up)
+            -cam[0] * UE_TO_AL_SCALE   # UE4 X (forward) -> OpenAL -Z (forward)
         )
+        self._al_source_pos = (
+            npc[1] * UE_TO_AL_SCALE,
+            npc[2] * UE_TO_AL_SCALE,
+            -npc[0] * UE_TO_AL_SCALE
+        )
+        # Convert yaw to forward vector (only when yaw changed - moving without
+        # turning is common)
+        # UE4 yaw: 0=+X(forward), 90=+Y(right)
+        # OpenAL: forward=-Z, right=+X
+        yaw = self.cam_yaw
+        if yaw != self._al_orientation_yaw:
+            yaw_rad = math.radians(yaw)
+            # Forward vector (at) in OpenAL coords, then up vector
+            self._al_orientation = (math.sin(yaw_rad), 0, -math.cos(yaw_rad), 0, 1, 0)
+            self._al_orientation_yaw = yaw
+
+    def get_listener_position(self):
+        """Get camera position for OpenAL listener"""
+        return self._al_listener_pos
 
     def get_listener_orientation(self):
         """Get camera orientation for OpenAL listener (at, up vectors)"""
-        # Convert yaw to forward vector
-        # UE4 yaw: 0=+X(forward), 90=+Y(right)
-        # OpenAL: forward=-Z, right=+X
-        yaw_rad = math.radians(self.cam_yaw)
-        # Forward vector (at) in OpenAL coords
-        fx = math.sin(yaw_rad)   # right component
-        fz = -math.cos(yaw_rad)  # forward component (negative Z)
-        # Up vector
-        return (fx, 0, fz, 0, 1, 0)
+        return self._al_orientation
 
     def get_source_position(self):
         """Get NPC position for OpenAL source"""
-        # Convert UE4 coords to OpenAL
-        # UE4: X=forward, Y=right, Z=up
-        # OpenAL: X=right, Y=up, Z=backward
-        scale = 0.01
-        return (
-            self.npc_pos[1] * scale,   # UE4 Y (right) -> OpenAL X (right)
-            self.npc_pos[2] * scale,   # UE4 Z (up) -> OpenAL Y (up)
-            -self.npc_pos[0] * scale   # UE4 X (forward) -> OpenAL -Z (forward)
-        )
+        return self._al_source_pos
 
 
 # ============================================
 # TTS Stream Adapter
 # ============================================
+# Diagnostic history kept per TTSStream list (most recent entries only)
+TTS_STREAM_DIAG_HISTORY = 2048
+
+# TTS providers deliver variable-sized chunks; OpenAL streams more smoothly from
+# uniform buffers, so fed PCM is re-chunked to this size before queueing
+TTS_STREAM_CHUNK_BYTES = 8192
+
+# OpenAL stream buffers per TTS source. Every buffer holds one full chunk, real
+# audio or underrun silence alike, so in-flight audio is always
+# MIN_STREAM_BUFFERS * chunk duration: 4 x 8 KB = ~680 ms at 24 kHz mono,
+# ~370 ms at 44.1 kHz. That is also the headroom the update loop has on an
+# underrun before the source drains and stops.
+MIN_STREAM_BUFFERS = 4
+
+# Minimum audio fed (queued chunks plus the partial one) before play_stream creates
+# the SourceStream; enough chunks to fill every stream buffer also counts.
+# Starting on a single buffer guarantees an immediate underrun. This is the
+# player-side floor only: services/tts/base.py already holds playback back
+# until constants.TTS_BUFFER_SECONDS of audio arrived (or TTS finished), so it
+# matters for streams handed to play_stream before that point.
+MIN_BUFFER_SECONDS_TO_START = 0.2
+
+# Rate used for the init() prewarm source (matches the usual TTS output rate)
+PREWARM_SAMPLE_RATE = 24000
+
+
+class _SilenceStream:
+    """Minimal SourceStream input: one block of 16-bit mono silence, then end."""
+
+    def __init__(self, sample_rate, seconds):
+        self.frequency = sample_rate
+        self.channels = 1
+        self.bits = 16
+        self.length = 0
+        self._data = b'\x00\x00' * int(sample_rate * seconds)
+
+    def get_buffer(self):
+        data, self._data = self._data, None
+        return (data, len(data)) if data else None
+
+
 class TTSStream:
     """
     Stream adapter for real-time TTS PCM chunks.
     Implements the interface expected by PyOpenAL's SourceStream.
     """
 
-    def __init__(self, sample_rate=44100, channels=1, bits=16):
+    def __init__(self, sample_rate=44100, channels=1, bits=16, diag=False):
         # Required by PyOpenAL
         self.frequency = sample_rate
         self.channels = channels
@@ -231,111 +394,188 @@ class TTSStream:
         self.length = 0  # Unknown length for streaming
 
         # Internal state
-        self.buffer_queue = queue.Queue()
+        # Single producer (feed) / single consumer (get_buffer): deque append and
+        # popleft are atomic under the GIL, so no Queue locking is needed
+        self.buffer_queue = deque()
+        # Fed PCM not yet making up a whole buffer (frame-aligned chunk size).
+        # Guarded by a lock: get_buffer may flush it early on underrun.
+        frame_bytes = max(1, channels * bits // 8)
+        self._chunk_bytes = max(frame_bytes, TTS_STREAM_CHUNK_BYTES - TTS_STREAM_CHUNK_BYTES % frame_bytes)
+        self._pending = bytearray()
+        self._pending_lock = threading.Lock()
+        # Set once enough audio is queued to start playback (or the stream is flushed)
+        self.prebuffer_event = threading.Event()
+        self._prebuffer_bytes = int(sample_rate * frame_bytes * MIN_BUFFER_SECONDS_TO_START)
+        # OpenAL buffers the SourceStream will use (each holds one chunk; set in init())
+        self.stream_buffer_count = MIN_STREAM_BUFFERS
+        # Silence returned on underrun to keep the stream alive: a whole chunk, so an
+        # underrun doesn't shrink the queued headroom. PyOpenAL copies the data into
+        # an AL buffer, so the one immutable block is safe to reuse.
+        silence = bytes(self._chunk_bytes)
+        self._silence_buffer = (silence, len(silence))
         self.done = False
         self.exists = True
         self._total_fed = 0
         self.playback_started = False  # Set by Audio3DPlayer after source.play()
 
-        # DIAGNOSTIC: Streaming metrics for debugging audio hitches
+        # Streaming counters (always kept, cheap)
         self._chunk_count = 0
         self._silence_count = 0
         self._total_pulled = 0
-        self._feed_times = []      # Timestamps of feed() calls
-        self._pull_times = []      # Timestamps of get_buffer() calls
-        self._chunk_sizes = []     # Size of each chunk fed
-        self._queue_depths = []    # Queue depth at each pull
-        self._underrun_times = []  # When silence was returned (elapsed seconds)
         self._first_feed_time = None
+
+        # DIAGNOSTIC: Per-chunk logging and timing for debugging audio hitches
+        self._diag = diag or TTS_STREAM_DIAGNOSTICS
+        # Bounded windows (most recent TTS_STREAM_DIAG_HISTORY entries) so long turns don't grow memory
+        self._feed_times = deque(maxlen=TTS_STREAM_DIAG_HISTORY)      # Timestamps of feed() calls
+        self._pull_times = deque(maxlen=TTS_STREAM_DIAG_HISTORY)      # Timestamps of get_buffer() calls
+        self._chunk_sizes = deque(maxlen=TTS_STREAM_DIAG_HISTORY)     # Size of each chunk fed
+        self._queue_depths = deque(maxlen=TTS_STREAM_DIAG_HISTORY)    # Queue depth at each pull
+        self._underrun_times = deque(maxlen=TTS_STREAM_DIAG_HISTORY)  # When silence was returned (elapsed seconds)
+        self._pull_count = 0
         self._first_pull_time = None
 
     def feed(self, pcm_bytes):
         """Feed PCM data chunk (called by TTS provider)"""
         if self.exists and pcm_bytes:
-            now = time.time()
+            size = len(pcm_bytes)
+            self._chunk_count += 1
+            self._total_fed += size
 
-            # DIAGNOSTIC: Track first chunk timing
             if self._first_feed_time is None:
-                self._first_feed_time = now
-                print(f"[TTSStream] FIRST CHUNK at t=0.000s, size={len(pcm_bytes)} bytes")
-
-            self._chunk_count += 1
-            self._total_fed += len(pcm_bytes)
-            self._feed_times.append(now)
-            self._chunk_sizes.append(len(pcm_bytes))
+                self._first_feed_time = time.monotonic()
+                if self._diag:
+                    print(f"[TTSStream] FIRST CHUNK at t=0.000s, size={size} bytes")
+
+            if self._diag:
+                self._log_feed(pcm_bytes)
+
+            n = self._chunk_bytes
+            with self._pending_lock:
+                pending = self._pending
+                pending += pcm_bytes
+                whole = len(pending) - len(pending) % n
+                if whole:
+                    # Copy each buffer straight out of a view: one allocation per
+                    # buffer instead of a bytearray slice plus its bytes() copy.
+                    # The view must be released before pending is resized.
+                    with memoryview(pending) as view:
+                        for i in range(0, whole, n):
+                            self.buffer_queue.append(view[i:i + n].tobytes())
+                    del pending[:whole]
+                if not self.prebuffer_event.is_set():
+                    queued = len(self.buffer_queue)
+                    # The partial chunk counts: get_buffer flushes it on underrun
+                    if (queued * n + len(pending) >= self._prebuffer_bytes
+                            or queued >= self.stream_buffer_count):
+                        self.prebuffer_event.set()
+
+    def _flush_pending(self):
+        """Queue any partial buffer as-is. Returns True if something was queued."""
+        with self._pending_lock:
+            if not self._pending:
+                return False
+            self.buffer_queue.append(bytes(self._pending))
+            self._pending.clear()
+            self.prebuffer_event.set()
+            return True
 
-            # Calculate inter-chunk gap and log
-            elapsed = now - self._first_feed_time
-            if len(self._feed_times) > 1:
-                gap = now - self._feed_times[-2]
-                print(f"[TTSStream] FEED #{self._chunk_count}: {len(pcm_bytes)} bytes, "
-                      f"gap={gap*1000:.1f}ms, elapsed={elapsed:.2f}s, queue={self.buffer_queue.qsize()}")
+    def _log_feed(self, pcm_bytes):
+        """DIAGNOSTIC: Record and log one fed chunk (only when diagnostics enabled)"""
+        now = time.monotonic()
+        size = len(pcm_bytes)
+        self._feed_times.append(now)
+        self._chunk_sizes.append(size)
 
-            # DIAGNOSTIC: Check for WAV header in chunk (shouldn't happen after stripping in inworld.py)
-            if len(pcm_bytes) >= 4 and pcm_bytes[:4] == b'RIFF':
-                print(f"[TTSStream] WARNING: Chunk #{self._chunk_count} contains WAV header! (not stripped)")
+        # Calculate inter-chunk gap and log
+        elapsed = now - self._first_feed_time
+        if len(self._feed_times) > 1:
+            gap = now - self._feed_times[-2]
+            print(f"[TTSStream] FEED #{self._chunk_count}: {size} bytes, "
+                  f"gap={gap*1000:.1f}ms, elapsed={elapsed:.2f}s, queue={len(self.buffer_queue)}")
 
-            # DIAGNOSTIC: Check PCM alignment (16-bit audio should have even byte count)
-            if len(pcm_bytes) % 2 != 0:
-                print(f"[TTSStream] WARNING: Chunk #{self._chunk_count} has ODD size {len(pcm_bytes)} (misaligned PCM)")
+        # Check for WAV header in chunk (shouldn't happen after stripping in inworld.py)
+        if size >= 4 and pcm_bytes[:4] == b'RIFF':
+            print(f"[TTSStream] WARNING: Chunk #{self._chunk_count} contains WAV header! (not stripped)")
 
-            self.buffer_queue.put(pcm_bytes)
+        # Check PCM alignment (16-bit audio should have even byte count)
+        if size % 2 != 0:
+            print(f"[TTSStream] WARNING: Chunk #{self._chunk_count} has ODD size {size} (misaligned PCM)")
 
     def finish(self):
         """Signal end of TTS stream"""
-        elapsed = time.time() - self._first_feed_time if self._first_feed_time else 0
-        remaining = self.buffer_queue.qsize()
+        elapsed = time.monotonic() - self._first_feed_time if self._first_feed_time else 0
+        remaining = len(self.buffer_queue)
         print(f"[TTSStream] FINISH called at {elapsed:.2f}s, {remaining} chunks remaining in queue, total fed: {self._total_fed} bytes")
+        self._flush_pending()  # Last partial buffer
         self.done = True
+        self.prebuffer_event.set()  # Short/empty stream: nothing more is coming
 
     def get_buffer(self):
         """Get next buffer (called by PyOpenAL SourceStream)"""
         if not self.exists:
             return None
 
-        now = time.time()
-
-        # DIAGNOSTIC: Track first pull timing
-        if self._first_pull_time is None:
-            self._first_pull_time = now
-            print(f"[TTSStream] FIRST PULL at t=0.000s")
-
-        queue_depth = self.buffer_queue.qsize()
-        self._queue_depths.append(queue_depth)
-        self._pull_times.append(now)
-        elapsed = now - self._first_pull_time
+        if self._diag:
+            self._log_pull()
 
         try:
             # Non-blocking get - return immediately
-            data = self.buffer_queue.get_nowait()
+            data = self.buffer_queue.popleft()
             self._total_pulled += len(data)
-
-            # DIAGNOSTIC: Log every 50th pull to avoid spam (but always log first few)
-            pull_count = len(self._pull_times)
-            if pull_count <= 5 or pull_count % 50 == 0:
-                print(f"[TTSStream] PULL #{pull_count}: {len(data)} bytes, "
-                      f"queue={queue_depth}, elapsed={elapsed:.2f}s")
-
             return (data, len(data))
-        except queue.Empty:
-            if self.done and self.buffer_queue.empty():
+        except IndexError:
+            # Producer is between whole buffers: play the partial one rather than silence
+            if self._pending and self._flush_pending():
+                data = self.buffer_queue.popleft()
+                self._total_pulled += len(data)
+                return (data, len(data))
+
+            if self.done and not self.buffer_queue:
                 self._print_summary()
                 self.exists = False
                 return None
 
-            # Only log underruns during actual playback (not initial buffer fill)
+            # Only count underruns during actual playback (not initial buffer fill)
             if self.playback_started:
                 self._silence_count += 1
-                self._underrun_times.append(elapsed)
-                print(f"[TTSStream] *** UNDERRUN #{self._silence_count} *** "
-                      f"at elapsed={elapsed:.2f}s, queue=EMPTY")
+                if self._diag:
+                    elapsed = time.monotonic() - self._first_pull_time
+                    self._underrun_times.append(elapsed)
+                    print(f"[TTSStream] *** UNDERRUN #{self._silence_count} *** "
+                          f"at elapsed={elapsed:.2f}s, queue=EMPTY")
+
+            # Return a chunk of silence to keep the stream alive
+            return self._silence_buffer
+
+    def _log_pull(self):
+        """DIAGNOSTIC: Record and log one pull (only when diagnostics enabled)"""
+        now = time.monotonic()
+
+        # Track first pull timing
+        if self._first_pull_time is None:
+            self._first_pull_time = now
+            print(f"[TTSStream] FIRST PULL at t=0.000s")
 
-            # Return small silence chunk to keep stream alive
-            silence = b'\x00\x00' * 512
-            return (silence, len(silence))
+        queue_depth = len(self.buffer_queue)
+        self._queue_depths.append(queue_depth)
+        self._pull_times.append(now)
+
+        # Log every 50th pull to avoid spam (but always log first few)
+        self._pull_count += 1
+        pull_count = self._pull_count
+        if queue_depth and (pull_count <= 5 or pull_count % 50 == 0):
+            elapsed = now - self._first_pull_time
+            print(f"[TTSStream] PULL #{pull_count}: {len(self.buffer_queue[0])} bytes, "
+                  f"queue={queue_depth}, elapsed={elapsed:.2f}s")
 
     def _print_summary(self):
         """Print streaming summary on completion - helps diagnose audio issues"""
+        if not self._diag:
+            print(f"[TTSStream] Stream complete: {self._chunk_count} chunks, {self._total_fed} bytes fed, "
+                  f"{self._silence_count} underruns")
+            return
+
         duration = self._pull_times[-1] - self._first_pull_time if self._pull_times else 0
         print(f"\n[TTSStream] === STREAMING SUMMARY ===")
         print(f"[TTSStream] Total chunks fed: {self._chunk_count}")
@@ -346,10 +586,10 @@ class TTSStream:
 
         if self._underrun_times:
             # Show first 10 underrun timestamps
-            timestamps = [f'{t:.2f}s' for t in self._underrun_times[:10]]
+            timestamps = [f'{t:.2f}s' for t in islice(self._underrun_times, 10)]
             print(f"[TTSStream] Underrun timestamps: {timestamps}")
-            if len(self._underrun_times) > 10:
-                print(f"[TTSStream]   ... and {len(self._underrun_times) - 10} more")
+            if self._silence_count > 10:
+                print(f"[TTSStream]   ... and {self._silence_count - 10} more")
 
         if self._chunk_sizes:
             print(f"[TTSStream] Chunk size range: {min(self._chunk_sizes)}-{max(self._chunk_sizes)} bytes")
@@ -357,7 +597,7 @@ class TTSStream:
             print(f"[TTSStream] Avg chunk size: {avg_size:.0f} bytes")
 
         if self._feed_times and len(self._feed_times) > 1:
-            gaps = [self._feed_times[i] - self._feed_times[i-1] for i in range(1, len(self._feed_times))]
+            gaps = [b - a for a, b in zip(self._feed_times, islice(self._feed_times, 1, None))]
             print(f"[TTSStream] Inter-chunk gaps: min={min(gaps)*1000:.1f}ms, max={max(gaps)*1000:.1f}ms, avg={sum(gaps)/len(gaps)*1000:.1f}ms")
 
         # Calculate buffer health
@@ -387,12 +627,23 @@ class Audio3DPlayer:
         self.source = None
         self.position_reader = PositionReader()
         self._update_thread = None
+        # Position-thread lifetime: set at the end of EVERY playback (normal or not)
+        # and by shutdown(). Kept apart from _abort_event because a normal end must
+        # stop the thread without reporting the playback as aborted.
         self._stop_event = threading.Event()
-        self.abort_flag = False  # For interruption support
+        # Interruption: set by abort()/shutdown(), cleared when a playback starts/ends.
+        # All playback wait loops block on it, so an abort wakes them immediately;
+        # play_file/play_stream report it as their result.
+        self._abort_event = threading.Event()
+
+    @property
+    def abort_flag(self):
+        """True once abort() was called for the current playback."""
+        return self._abort_event.is_set()
 
     def abort(self):
         """Signal playback to stop immediately (for interruption handling)."""
-        self.abort_flag = True
+        self._abort_event.set()
 
     def init(self):
         """Initialize OpenAL"""
@@ -402,17 +653,37 @@ class Audio3DPlayer:
 
         try:
             oalInit()
-            oalSetStreamBufferCount(16)  # More buffers for streaming
+            # Read by every SourceStream constructor (prewarm, files, TTS streams);
+            # TTSStream.stream_buffer_count matches it
+            oalSetStreamBufferCount(MIN_STREAM_BUFFERS)
             self.initialized = True
+            self._prewarm()
             print("[Audio3D] OpenAL initialized")
             return True
         except Exception as e:
             print(f"[Audio3D] Failed to initialize: {e}")
             return False
 
+    def _prewarm(self):
+        """
+        Play 20ms of silence at zero gain so device/mixer start-up and the first
+        stream source/buffer allocation happen here rather than on the first line.
+        """
+        try:
+            source = SourceStream(_SilenceStream(PREWARM_SAMPLE_RATE, 0.02))
+            source.set_gain(0.0)
+            source.play()
+            deadline = time.monotonic() + 0.5
+            while source.get_state() == AL_PLAYING and time.monotonic() < deadline:
+                time.sleep(0.01)
+            source.destroy()  # Stops it if still playing
+        except Exception as e:
+            print(f"[Audio3D] Prewarm failed (non-fatal): {e}")
+
     def shutdown(self):
         """Cleanup OpenAL"""
         self._stop_event.set()
+        self._abort_event.set()  # Wake any playback wait loop
         if self._update_thread:
             self._update_thread.join(timeout=1.0)
         if self.source:
@@ -431,27 +702,50 @@ class Audio3DPlayer:
     def _update_positions(self):
         """Update listener and source positions (runs in thread)"""
         listener = oalGetListener()
+        _raise_current_thread_priority()
+
+        reader = self.position_reader
+        # Last values pushed to OpenAL - inaudible changes are not re-sent
+        pushed_listener_pos = pushed_orientation = pushed_source_pos = None
 
+        # Absolute-deadline pacing: sleep() overshoot doesn't accumulate into drift
+        next_tick = time.monotonic()
         while not self._stop_event.is_set():
             try:
                 # Fetch latest position from socket (updates prev/curr if new data)
-                self.position_reader.update()
+                reader.update()
 
                 # Interpolate between prev and curr for smooth panning
-                self.position_reader.interpolate()
+                reader.interpolate()
 
                 # Update listener (camera)
-                listener.set_position(self.position_reader.get_listener_position())
-                listener.set_orientation(self.position_reader.get_listener_orientation())
+                pos = reader.get_listener_position()
+                if _moved(pos, pushed_listener_pos, POSITION_PUSH_THRESHOLD_SQ):
+                    listener.set_position(pos)
+                    pushed_listener_pos = pos
+                orientation = reader.get_listener_orientation()
+                if _moved(orientation, pushed_orientation, ORIENTATION_PUSH_THRESHOLD_SQ):
+                    listener.set_orientation(orientation)
+                    pushed_orientation = orientation
 
                 # Update source (NPC)
-                if self.source:
-                    self.source.set_position(self.position_reader.get_source_position())
-
-                time.sleep(0.02)  # 50Hz update
+                source = self.source
+                if source:
+                    pos = reader.get_source_position()
+                    if _moved(pos, pushed_source_pos, POSITION_PUSH_THRESHOLD_SQ):
+                        source.set_position(pos)
+                        pushed_source_pos = pos
             except:
                 pass
 
+            next_tick += POSITION_UPDATE_INTERVAL
+            remaining = next_tick - time.monotonic()
+            if remaining < 0:
+                # Fell behind (stall) - resync rather than burst to catch up
+                next_tick = time.monotonic()
+                remaining = 0
+            self._stop_event.wait(remaining)  # 50Hz update, returns early on stop
+
     def play_file(self, filename):
         """Play a WAV file with 3D positioning"""
         if not self.initialized:
@@ -463,6 +757,8 @@ class Audio3DPlayer:
             print(f"[Audio3D] File not found: {filepath}")
             return False
 
+        self._abort_event.clear()  # Reset abort at start
+
         try:
             # Load file and create source
             wav = WaveFile(filepath)
@@ -486,10 +782,12 @@ class Audio3DPlayer:
             print("[Audio3D] Playing...")
             self.source.play()
 
-            # Wait for completion
+            # Wait for completion (returns early on abort)
             try:
                 while self.source and self.source.get_state() == AL_PLAYING:
-                    time.sleep(0.05)
+                    if self._abort_event.wait(0.05):
+                        self.source.stop()
+                        break
             except Exception as e:
                 print(f"[Audio3D] State check error: {e}")
 
@@ -502,10 +800,13 @@ class Audio3DPlayer:
                     print(f"[Audio3D] Destroy error: {e}")
                 self.source = None
 
-            print("[Audio3D] Playback complete")
-            return True
+            aborted = self._abort_event.is_set()
+            self._abort_event.clear()
+            print(f"[Audio3D] Playback {'aborted' if aborted else 'complete'}")
+            return not aborted
 
         except Exception as e:
+            self._stop_event.set()
             print(f"[Audio3D] Playback error: {e}")
             import traceback
             traceback.print_exc()
@@ -523,37 +824,40 @@ class Audio3DPlayer:
             if not self.init():
                 return False
 
-        self.abort_flag = False  # Reset abort flag at start
+        self._abort_event.clear()  # Reset abort at start
 
         try:
             # CRITICAL: Wait for buffer to have data BEFORE creating SourceStream
-            # SourceStream constructor pulls 15+ buffers synchronously, causing underruns
-            # if the queue is empty
+            # SourceStream constructor pulls all its buffers synchronously, causing
+            # underruns if the queue is empty
             print("[Audio3D] Waiting for buffer data before SourceStream creation...")
-            wait_start = time.time()
-            while tts_stream.buffer_queue.empty():
-                if time.time() - wait_start > 10.0:
+            # Woken by the producer once MIN_BUFFER_SECONDS_TO_START (or stream_buffer_count chunks)
+            # is queued, or the stream finished
+            wait_start = time.monotonic()
+            while not tts_stream.prebuffer_event.wait(0.02):
+                if time.monotonic() - wait_start > 10.0:
                     print("[Audio3D] ERROR: Timeout waiting for buffer data")
                     return False
-                if self.abort_flag:
+                if self._abort_event.is_set():
                     print("[Audio3D] Aborted while waiting for buffer")
                     return False
-                time.sleep(0.01)
+            if tts_stream.done and not tts_stream.buffer_queue:
+                print("[Audio3D] ERROR: Stream finished without any audio")
+                return False
 
-            queue_size = tts_stream.buffer_queue.qsize()
+            queue_size = len(tts_stream.buffer_queue)
             print(f"[Audio3D] Buffer has {queue_size} chunk(s), creating SourceStream...")
 
             # NOW create streaming source (it will pull from populated queue)
-            self.source = SourceStream(tts_stream)
+            self.source = BatchedSourceStream(tts_stream)
 
             # Configure audio - 3D or centered stereo
             if use_3d:
                 # NOTE: Initial positions are set via set_initial_positions() BEFORE this call
                 # No need to call update() here - positions are passed explicitly through the call chain
 
-                # Load audio settings
-                from utils.settings import load_settings
-                settings = load_settings()
+                # Load audio settings (cached until settings.json changes)
+                settings = load_settings_cached()
                 audio_cfg = settings.get('audio', {})
 
                 # Volume: user % + 50% boost (100% = 1.0 + 0.5 = 1.5 gain)
@@ -622,7 +926,7 @@ class Audio3DPlayer:
                 update_count += 1
 
                 # DIAGNOSTIC: Log state every 100 updates (~1 second at 10ms sleep)
-                if update_count % 100 == 0:
+                if TTS_STREAM_DIAGNOSTICS and update_count % 100 == 0:
                     elapsed = time.time() - playback_start
                     try:
                         state = self.source.get_state() if self.source else 0
@@ -630,8 +934,8 @@ class Audio3DPlayer:
                     except Exception:
                         pass  # Skip logging if state check fails
 
-                # Check for abort (interruption)
-                if self.abort_flag:
+                # Pace the loop; returns early (True) on abort (interruption)
+                if self._abort_event.wait(0.01):
                     print("[Audio3D] Playback aborted")
                     try:
                         if self.source:
@@ -639,23 +943,21 @@ class Audio3DPlayer:
                     except Exception:
                         pass
                     break
-                time.sleep(0.01)
 
             print(f"[Audio3D] Update loop ended after {update_count} updates")
 
             # Wait for final buffers to finish (unless aborted)
             wait_start = time.time()
-            if not self.abort_flag and self.source is not None:
+            if not self._abort_event.is_set() and self.source is not None:
                 try:
                     while self.source.get_state() == AL_PLAYING:
-                        if self.abort_flag:
+                        if self._abort_event.wait(0.02):
                             # Abort requested during wait - stop immediately
                             try:
                                 self.source.stop()
                             except Exception:
                                 pass
                             break
-                        time.sleep(0.02)
                 except Exception:
                     pass  # State check failed, assume done
 
@@ -671,13 +973,14 @@ class Audio3DPlayer:
                 except Exception:
                     pass
                 self.source = None
-            aborted = self.abort_flag
-            self.abort_flag = False  # Reset for next playback
+            aborted = self._abort_event.is_set()
+            self._abort_event.clear()  # Reset for next playback
             print(f"[Audio3D] Playback {'aborted' if aborted else 'complete'}: total={total_duration:.2f}s, final_buffer_wait={wait_duration:.2f}s")
             return not aborted
 
         except Exception as e:
             tts_stream.playback_started = False
+            self._stop_event.set()  # Don't leave the position thread running
             print(f"[Audio3D] Stream error: {e}")
             import traceback
             traceback.print_exc()
@@ -700,9 +1003,9 @@ def play_file_3d(filename):
     """Play a WAV file with 3D audio"""
     return get_player().play_file(filename)
 
-def create_tts_stream(sample_rate=44100, channels=1):
-    """Create a TTS stream for feeding PCM chunks"""
-    return TTSStream(sample_rate, channels)
+def create_tts_stream(sample_rate=44100, channels=1, diag=False):
+    """Create a TTS stream for feeding PCM chunks (diag=True for per-chunk logging)"""
+    return TTSStream(sample_rate, channels, diag=diag)
 
 def play_tts_stream(stream):
     """Play a TTS stream with 3D audio"""
@@ -9,7 +9,7 @@ Contains configuration and runtime data files:
 - dialogue_history.json: Conversation history
 - landmark_locations.json: World location data
 - voice_manifest.json: Voice sample metadata
-- system_events.json: Event log for dashboard
+- system_events.jsonl: Event log for dashboard (one JSON event per line)
 """
 from pathlib import Path
 
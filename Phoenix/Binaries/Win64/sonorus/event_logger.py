@@ -2,8 +2,11 @@
 Event logging system for Sonorus - centralized event tracking and dashboard display.
 Thread-safe logging of LLM calls, TTS operations, voice cloning, and vision captures.
 """
+import atexit
+import collections
 import json
 import os
+import queue
 import threading
 import time
 import uuid
@@ -12,9 +15,24 @@ from typing import Optional, Dict, Any, List
 
 # Module state
 from utils.settings import DATA_DIR
-EVENTS_FILE = Path(DATA_DIR) / "system_events.json"
+# JSON Lines: one event per line, so logging an event is a single append
+EVENTS_FILE = Path(DATA_DIR) / "system_events.jsonl"
+LEGACY_EVENTS_FILE = Path(DATA_DIR) / "system_events.json"  # Pre-JSONL format, migrated on load
 MAX_EVENTS = 100
 _events_lock = threading.Lock()
+_line_count = None  # Lines currently in EVENTS_FILE (None = not counted yet)
+
+# In-memory copy of the most recent events (source of truth for readers; the
+# file is a persistence mirror). Loaded from disk on first use.
+_recent_events = None
+_recent_lock = threading.Lock()  # Separate from _events_lock: never held across disk writes
+
+# Callers only enqueue; a background thread batches the file appends
+FLUSH_INTERVAL = 0.1  # Seconds to let a burst of events accumulate before writing
+_pending_events = queue.SimpleQueue()
+_flush_wake = threading.Event()
+_flusher_thread = None
+_flusher_start_lock = threading.Lock()
 
 
 def _generate_event_id() -> str:
@@ -24,28 +42,136 @@ def _generate_event_id() -> str:
     return f"evt_{timestamp_ms}_{uuid_short}"
 
 
+def _encode_event(event: Dict[str, Any]) -> str:
+    """Serialize one event as a JSON Lines record."""
+    return json.dumps(event, separators=(',', ':')) + '\n'
+
+
+def _migrate_legacy_events() -> None:
+    """One-time conversion of the old JSON array file to JSONL (old file removed after)."""
+    try:
+        content = LEGACY_EVENTS_FILE.read_text(encoding='utf-8').strip()
+        events = json.loads(content) if content else []
+        if not isinstance(events, list):
+            raise ValueError("expected a JSON list")
+        _save_events(events)
+        if EVENTS_FILE.exists():
+            LEGACY_EVENTS_FILE.unlink()
+            print(f"[EventLogger] Migrated {LEGACY_EVENTS_FILE.name} to {EVENTS_FILE.name}")
+    except Exception as e:
+        print(f"[EventLogger] Error migrating {LEGACY_EVENTS_FILE.name}: {e}")
+
+
 def _load_events() -> List[Dict[str, Any]]:
-    """Load events from JSON file. Returns empty list if file doesn't exist or is empty."""
+    """Load events from JSONL file. Returns empty list if file doesn't exist or is empty."""
+    global _line_count
+    events = []
     try:
+        if LEGACY_EVENTS_FILE.exists() and not EVENTS_FILE.exists():
+            _migrate_legacy_events()
         if EVENTS_FILE.exists():
-            content = EVENTS_FILE.read_text(encoding='utf-8').strip()
-            if content:
-                return json.loads(content)
+            lines = EVENTS_FILE.read_text(encoding='utf-8').splitlines()
+            _line_count = len(lines)
+            for line in lines:
+                if not line:
+                    continue
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    pass  # Torn last line from an interrupted write
+        else:
+            _line_count = 0
     except Exception as e:
         print(f"[EventLogger] Error loading events: {e}")
-    return []
+    return events
 
 
 def _save_events(events: List[Dict[str, Any]]) -> None:
-    """Save events to JSON file with auto-trim to MAX_EVENTS."""
+    """Rewrite JSONL file with auto-trim to MAX_EVENTS (atomic replace)."""
+    global _line_count
     try:
         # Keep only most recent MAX_EVENTS
         events = events[-MAX_EVENTS:]
 
-        with open(EVENTS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(events, f, indent=2)
+        tmp_file = EVENTS_FILE.with_suffix('.jsonl.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.writelines(_encode_event(e) for e in events)
+            f.flush()
+            os.fsync(f.fileno())  # Data on disk before the rename makes it visible
+        os.replace(tmp_file, EVENTS_FILE)
+        _line_count = len(events)
+    except Exception as e:
+        print(f"[EventLogger] Error saving events: {e}")
+
+
+def _append_events(events: List[Dict[str, Any]]) -> None:
+    """
+    Append events to the JSONL file. Trimming is amortized: the file is only
+    rewritten once it holds more than 2 * MAX_EVENTS lines.
+    Caller must hold _events_lock.
+    """
+    global _line_count
+    try:
+        if _line_count is None:
+            _load_events()  # Count existing lines once
+        with open(EVENTS_FILE, 'a', encoding='utf-8') as f:
+            f.writelines(_encode_event(e) for e in events)
+        _line_count += len(events)
     except Exception as e:
         print(f"[EventLogger] Error saving events: {e}")
+        return
+
+    if _line_count > 2 * MAX_EVENTS:
+        _save_events(_load_events())
+
+
+def _flusher_loop() -> None:
+    """Background writer: wait for events, let a burst accumulate, append it in one write."""
+    while True:
+        _flush_wake.wait()
+        time.sleep(FLUSH_INTERVAL)
+        _flush_wake.clear()  # Cleared before draining so later events re-wake us
+        flush_now()
+
+
+def _ensure_flusher() -> None:
+    """Start the background writer on first use."""
+    global _flusher_thread
+    if _flusher_thread is not None:
+        return
+    with _flusher_start_lock:
+        if _flusher_thread is None:
+            _flusher_thread = threading.Thread(target=_flusher_loop, daemon=True, name="EventLoggerFlush")
+            _flusher_thread.start()
+            atexit.register(flush_now)  # Daemon thread dies at exit: write what's left
+
+
+def _drain_pending() -> List[Dict[str, Any]]:
+    """Take all queued events (oldest first)."""
+    events = []
+    while True:
+        try:
+            events.append(_pending_events.get_nowait())
+        except queue.Empty:
+            return events
+
+
+def flush_now() -> None:
+    """Write all queued events to disk now (called by the writer thread and at exit)."""
+    with _events_lock:
+        events = _drain_pending()
+        if events:
+            _append_events(events)
+
+
+def _recent() -> "collections.deque":
+    """In-memory recent events, loaded from EVENTS_FILE on first use. Caller must hold _recent_lock."""
+    global _recent_events
+    if _recent_events is None:
+        with _events_lock:
+            loaded = _load_events()
+        _recent_events = collections.deque(loaded[-MAX_EVENTS:], maxlen=MAX_EVENTS)
+    return _recent_events
 
 
 def log_event(event_type: str, status: str = "success", data: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> str:
@@ -71,18 +197,19 @@ def log_event(event_type: str, status: str = "success", data: Optional[Dict[str,
         "error": error
     }
 
-    with _events_lock:
-        events = _load_events()
-        events.append(event)
-        _save_events(events)
+    with _recent_lock:
+        _recent().append(event)  # deque drops the oldest beyond MAX_EVENTS
+        _pending_events.put(event)
+    _ensure_flusher()
+    _flush_wake.set()
 
     return event_id
 
 
 def get_recent_events(limit: int = 100) -> List[Dict[str, Any]]:
     """Get most recent events (reverse chronological order)."""
-    with _events_lock:
-        events = _load_events()
+    with _recent_lock:
+        events = list(_recent())
 
     # Return most recent first
     return list(reversed(events[-limit:]))
@@ -90,8 +217,12 @@ def get_recent_events(limit: int = 100) -> List[Dict[str, Any]]:
 
 def clear_events() -> None:
     """Clear all events."""
-    with _events_lock:
-        _save_events([])
+    with _recent_lock:  # Lock order: _recent_lock before _events_lock
+        recent = _recent()  # May load from disk under _events_lock: must run before taking it
+        with _events_lock:
+            recent.clear()
+            _drain_pending()  # Queued events predate the clear
+            _save_events([])
 
 
 # ============================================
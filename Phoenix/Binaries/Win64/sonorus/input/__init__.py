@@ -5,6 +5,7 @@ Submodules:
 - text: In-game text input capture using pynput
 - voice: Push-to-talk audio capture for STT
 - hotkeys: Stop/reset conversation hotkey handling
+- win32: Shared typed user32 binding used by the hooks
 """
 from . import text
 from . import voice
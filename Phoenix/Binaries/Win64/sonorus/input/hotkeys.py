@@ -6,10 +6,10 @@ Uses pynput with game window check.
 """
 
 import threading
-import ctypes
+import queue
 from pynput import keyboard
 
-user32 = ctypes.windll.user32
+from .win32 import user32, is_game_window_active
 
 # VK codes
 VK_F1 = 0x70
@@ -44,6 +44,8 @@ _listener = None
 _callback = None
 _hotkey_vk = VK_DELETE
 _check_pause = None
+_trigger_queue = queue.SimpleQueue()  # Hook -> callback worker
+_worker_thread = None
 
 
 def is_key_pressed(vk):
@@ -51,28 +53,6 @@ def is_key_pressed(vk):
     return (user32.GetAsyncKeyState(vk) & 0x8000) != 0
 
 
-def get_active_window_title():
-    """Get the title of the active window."""
-    try:
-        hwnd = user32.GetForegroundWindow()
-        if not hwnd:
-            return ""
-        length = user32.GetWindowTextLengthW(hwnd)
-        if length == 0:
-            return ""
-        buffer = ctypes.create_unicode_buffer(length + 1)
-        user32.GetWindowTextW(hwnd, buffer, length + 1)
-        return buffer.value
-    except:
-        return ""
-
-
-def is_game_window_active():
-    """Check if game window is in foreground."""
-    title = get_active_window_title().lower().strip()
-    return title == "hogwarts legacy"
-
-
 def _win32_event_filter(msg, data):
     """Low-level keyboard hook for reliable key capture."""
     global _callback, _hotkey_vk, _check_pause
@@ -81,32 +61,49 @@ def _win32_event_filter(msg, data):
     if msg not in (0x0100, 0x0104):  # WM_KEYDOWN, WM_SYSKEYDOWN
         return True  # Let it through
 
-    vk = data.vkCode
-
-    # Always let modifier combos through (Alt+Tab, Win key, etc)
-    if is_key_pressed(VK_MENU) or is_key_pressed(VK_LWIN) or is_key_pressed(VK_RWIN) or is_key_pressed(VK_CONTROL):
-        return True
-
-    # Only handle our hotkey
-    if vk != _hotkey_vk:
+    # Only handle our hotkey (checked first: nearly every key event exits here
+    # without any Win32 calls)
+    if data.vkCode != _hotkey_vk:
         return True
 
     # Only when game is active
     if not is_game_window_active():
         return True
 
+    # Always let modifier combos through (Alt+Tab, Win key, etc)
+    if is_key_pressed(VK_MENU) or is_key_pressed(VK_LWIN) or is_key_pressed(VK_RWIN) or is_key_pressed(VK_CONTROL):
+        return True
+
     # Check if game is paused
     if _check_pause and _check_pause():
         return True
 
-    # Trigger callback
+    # Trigger callback (on the worker thread - the hook must return quickly)
     if _callback:
-        threading.Thread(target=_callback, daemon=True).start()
+        _trigger_queue.put(None)
 
     # Suppress the key (don't let game see it)
     return False
 
 
+def _callback_worker():
+    """Run hotkey callbacks off the hook thread, one at a time."""
+    while True:
+        _trigger_queue.get()
+        # Presses queued while the previous callback ran collapse into one call
+        while True:
+            try:
+                _trigger_queue.get_nowait()
+            except queue.Empty:
+                break
+        callback = _callback
+        if callback:
+            try:
+                callback()
+            except Exception as e:
+                print(f"[StopCapture] Callback error: {e}")
+
+
 def start_capture(callback, hotkey='f8', check_pause=None):
     """
     Start listening for stop hotkey.
@@ -116,10 +113,14 @@ def start_capture(callback, hotkey='f8', check_pause=None):
         hotkey: Hotkey name ('f1'-'f10', 'escape')
         check_pause: Optional callback that returns True if game is paused
     """
-    global _listener, _callback, _hotkey_vk, _check_pause
+    global _listener, _callback, _hotkey_vk, _check_pause, _worker_thread
 
     stop_capture()  # Stop any existing listener
 
+    if _worker_thread is None:
+        _worker_thread = threading.Thread(target=_callback_worker, daemon=True)
+        _worker_thread.start()
+
     _callback = callback
     _check_pause = check_pause
     _hotkey_vk = HOTKEY_VK_MAP.get(hotkey.lower(), VK_DELETE)
@@ -3,15 +3,21 @@ In-Game Text Input Capture using pynput with win32_event_filter
 
 All key handling happens in win32_event_filter using Windows APIs.
 This ensures we can both capture AND suppress keys reliably.
+
+The filter runs inside the Windows low-level keyboard hook, which Windows
+silently drops if it is too slow to return. It only decides suppress/pass and
+translates the key; buffer edits, pastes, sending updates and vision capture
+run in order on a worker thread.
 """
 
 import threading
 import ctypes
+import queue
 import time
 import pyperclip
 from pynput import keyboard
 
-user32 = ctypes.windll.user32
+from .win32 import user32, get_active_window_title, is_game_window_active
 
 # Windows message types
 WM_KEYDOWN = 0x0100
@@ -40,41 +46,73 @@ VK_RMENU = 0xA5  # Right Alt
 VK_MODIFIERS = {VK_SHIFT, VK_CONTROL, VK_MENU, VK_LWIN, VK_RWIN,
                 VK_LSHIFT, VK_RSHIFT, VK_LCONTROL, VK_RCONTROL, VK_LMENU, VK_RMENU}
 
+# Modifier snapshot bits (see read_modifier_state)
+MOD_SHIFT = 0x1
+MOD_CTRL = 0x2
+MOD_ALT = 0x4
+MOD_WIN = 0x8
 
-def get_active_window_title():
-    try:
-        hwnd = user32.GetForegroundWindow()
-        if not hwnd:
-            return ""
-        length = user32.GetWindowTextLengthW(hwnd)
-        if length == 0:
-            return ""
-        buffer = ctypes.create_unicode_buffer(length + 1)
-        user32.GetWindowTextW(hwnd, buffer, length + 1)
-        return buffer.value
-    except:
-        return ""
-
-
-def is_game_window_active():
-    title = get_active_window_title().lower().strip()
-    return title == "hogwarts legacy"
 
 def is_key_pressed(vk):
     """Check if a key is currently pressed using GetAsyncKeyState."""
     return (user32.GetAsyncKeyState(vk) & 0x8000) != 0
 
 
-def vk_to_char(vk):
-    """Convert virtual key code to character using current keyboard state."""
+def read_modifier_state():
+    """
+    Snapshot physical modifier state as a MOD_* bitmask, once per key event.
+    The generic VK_SHIFT/VK_CONTROL/VK_MENU codes already cover both left and
+    right keys, so this is five GetAsyncKeyState calls.
+    """
+    mods = 0
+    if is_key_pressed(VK_SHIFT):
+        mods |= MOD_SHIFT
+    if is_key_pressed(VK_CONTROL):
+        mods |= MOD_CTRL
+    if is_key_pressed(VK_MENU):
+        mods |= MOD_ALT
+    if is_key_pressed(VK_LWIN) or is_key_pressed(VK_RWIN):
+        mods |= MOD_WIN
+    return mods
+
+
+# (layout, vk, shift, ctrl, caps) -> char for keys that translate to exactly one
+# character. Dead keys are never cached, and the key after a dead key bypasses
+# the cache (it may combine into an accented character).
+_char_cache = {}
+_dead_key_pending = False
+
+
+def vk_to_char(vk, mods=None, scan_code=None):
+    """
+    Convert virtual key code to character using current keyboard state.
+
+    Args:
+        vk: Virtual key code
+        mods: MOD_* bitmask from read_modifier_state() (read here if None)
+        scan_code: Hardware scan code from the hook event (looked up if None)
+    """
+    global _dead_key_pending
+    if mods is None:
+        mods = read_modifier_state()
+
+    # Caps lock toggle state (GetKeyState returns toggle in low bit)
+    caps_on = user32.GetKeyState(0x14) & 1  # VK_CAPITAL
+    cache_key = (user32.GetKeyboardLayout(0), vk, mods & (MOD_SHIFT | MOD_CTRL), caps_on)
+    if not _dead_key_pending:
+        try:
+            return _char_cache[cache_key]
+        except KeyError:
+            pass
+
     # Get current keyboard state
     keyboard_state = (ctypes.c_ubyte * 256)()
     if not user32.GetKeyboardState(keyboard_state):
         return None
 
     # In low-level hooks, GetKeyboardState may be stale.
-    # Manually set/clear shift state from GetAsyncKeyState (physical key state)
-    if is_key_pressed(VK_SHIFT) or is_key_pressed(VK_LSHIFT) or is_key_pressed(VK_RSHIFT):
+    # Manually set/clear shift state from the physical modifier snapshot
+    if mods & MOD_SHIFT:
         keyboard_state[VK_SHIFT] = 0x80
         keyboard_state[VK_LSHIFT] = 0x80
         keyboard_state[VK_RSHIFT] = 0x80
@@ -84,25 +122,46 @@ def vk_to_char(vk):
         keyboard_state[VK_LSHIFT] = 0x00
         keyboard_state[VK_RSHIFT] = 0x00
 
-    # Check caps lock toggle state (GetKeyState returns toggle in low bit)
-    if user32.GetKeyState(0x14) & 1:  # VK_CAPITAL
+    if caps_on:
         keyboard_state[0x14] = 0x01
 
-    # Get scan code for the virtual key
-    scan_code = user32.MapVirtualKeyW(vk, 0)
+    # Get scan code for the virtual key (the hook event already carries it)
+    if scan_code is None:
+        scan_code = user32.MapVirtualKeyW(vk, 0)
 
     # Convert to unicode character
     buffer = (ctypes.c_wchar * 5)()
     result = user32.ToUnicode(vk, scan_code, keyboard_state, buffer, 5, 0)
 
+    if result < 0:
+        _dead_key_pending = True  # Dead key: next key may combine with it
+        return None
+    was_pending, _dead_key_pending = _dead_key_pending, False
+
     if result == 1:
         char = buffer[0]
         # Only return printable characters
-        if char.isprintable():
-            return char
+        if not char.isprintable():
+            char = None
+        if not was_pending:
+            _char_cache[cache_key] = char
+        return char
     return None
 
 
+# Typing updates within this window are coalesced into one chat_input message
+UPDATE_COALESCE_INTERVAL = 0.016
+
+# str.translate table dropping the unprintable characters clipboard text
+# usually carries: C0/C1 controls, NBSP and the zero-width / bidi marks
+# and separators of General Punctuation. Anything rarer is caught by the
+# isprintable() fallback in _handle_paste.
+_PASTE_STRIP = dict.fromkeys(
+    i for r in (range(0x100), range(0x2000, 0x2070))
+    for i in r if not chr(i).isprintable()
+)
+
+
 class ChatInputCapture:
     def __init__(self, send_callback, hotkey='enter', check_pause=None):
         self.send = send_callback
@@ -111,11 +170,38 @@ class ChatInputCapture:
         self.check_pause = check_pause
 
         self.active = False
-        self.text_buffer = ""
-        self._lock = threading.Lock()
+        self._text_chars = []  # Typed characters; joined lazily by text_buffer
+        self._text = ""
+        self._text_dirty = False
+        self._update_pending = False  # A coalesced chat_input flush is queued
+        self._update_due = 0.0
+        self._lock = threading.Lock()  # Guards active (hook vs force_close)
         self.listener = None
         self._deactivate_time = 0  # Timestamp of last deactivation (to prevent key repeat issues)
 
+        # Work handed off from the hook (run in order by one worker thread).
+        # The text buffer is only touched on the worker.
+        self._work_q = None
+        self._worker = None
+        self._start_worker()
+
+    @property
+    def text_buffer(self):
+        """Current chat text (joined only after the buffer changed)."""
+        if self._text_dirty:
+            self._text = ''.join(self._text_chars)
+            self._text_dirty = False
+        return self._text
+
+    def _append_text(self, text):
+        self._text_chars.extend(text)
+        self._text_dirty = True
+
+    def _clear_text(self):
+        self._text_chars.clear()
+        self._text = ""
+        self._text_dirty = False
+
     def _parse_hotkey_vk(self, hotkey):
         """Convert hotkey name to VK code."""
         hotkey = hotkey.lower()
@@ -125,10 +211,37 @@ class ChatInputCapture:
             return VK_TAB
         elif len(hotkey) == 1:
             # For single characters, get VK code
-            return user32.VkKeyScanW(ord(hotkey)) & 0xFF
+            return user32.VkKeyScanW(hotkey) & 0xFF
         return VK_RETURN
 
+    def _queue_work(self, fn, *args):
+        """Run fn(*args) on the worker thread (FIFO)."""
+        try:
+            self._work_q.put_nowait((fn, args))
+        except queue.Full:
+            print(f"[InputCapture] Work queue full, dropped {fn.__name__}")
+
+    def _start_worker(self):
+        """Start the worker with a fresh queue (stop() retires the old one)."""
+        if self._worker is not None:
+            return
+        self._work_q = queue.Queue(maxsize=256)
+        self._worker = threading.Thread(target=self._work_loop, args=(self._work_q,), daemon=True)
+        self._worker.start()
+
+    def _work_loop(self, work_q):
+        while True:
+            item = work_q.get()
+            if item is None:
+                return  # stop()
+            fn, args = item
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"[InputCapture] Worker error in {fn.__name__}: {e}")
+
     def start(self):
+        self._start_worker()
         if self.listener is not None:
             return
         self.listener = keyboard.Listener(
@@ -155,13 +268,16 @@ class ChatInputCapture:
         if vk in VK_MODIFIERS:
             return
 
-        # Check modifier states directly from Windows
-        alt_pressed = is_key_pressed(VK_MENU) or is_key_pressed(VK_LMENU) or is_key_pressed(VK_RMENU)
-        win_pressed = is_key_pressed(VK_LWIN) or is_key_pressed(VK_RWIN)
-        ctrl_pressed = is_key_pressed(VK_CONTROL) or is_key_pressed(VK_LCONTROL) or is_key_pressed(VK_RCONTROL)
+        # Outside chat only the hotkey matters: every other key returns here
+        # before any Win32 call (modifier probes, foreground window)
+        if not self.active and vk != self.hotkey_vk:
+            return
+
+        # Check modifier states directly from Windows (one snapshot per event)
+        mods = read_modifier_state()
 
         # Always let Alt/Win combos through (system shortcuts)
-        if alt_pressed or win_pressed:
+        if mods & (MOD_ALT | MOD_WIN):
             return
 
         # === NOT IN CHAT MODE ===
@@ -186,19 +302,12 @@ class ChatInputCapture:
 
                 with self._lock:
                     self.active = True
-                    self.text_buffer = ""
 
                 # Trigger vision capture for fresh context
-                try:
-                    from vision_agent import get_agent
-                    agent = get_agent()
-                    if agent:
-                        agent.capture_now()
-                except Exception:
-                    pass  # Vision capture is optional
+                self._queue_work(self._capture_vision)
+                self._queue_work(self._open)
 
                 print("[InputCapture] Chat ACTIVE")
-                self._send_update()
                 # Suppress the hotkey so game doesn't see it
                 self.listener.suppress_event()
             return
@@ -208,85 +317,139 @@ class ChatInputCapture:
         if not is_game_window_active():
             with self._lock:
                 if self.active:
-                    self.active = False
-                    self._deactivate_time = time.time()
-                    self.text_buffer = ""
+                    self._deactivate()
+                    self._queue_work(self._close)
                     print("[InputCapture] Closed (game lost focus)")
-                    self._send_update()
             return  # Let key through to other applications
 
-        with self._lock:
-            if vk == VK_RETURN:
-                self._submit()
-            elif vk == VK_ESCAPE:
-                self._cancel()
-            elif vk == VK_BACK:
-                if self.text_buffer:
-                    self.text_buffer = self.text_buffer[:-1]
-                    self._send_update()
-            elif vk == VK_SPACE:
-                self.text_buffer += ' '
-                self._send_update()
-            elif vk == VK_TAB:
-                self.text_buffer += '    '
-                self._send_update()
-            elif ctrl_pressed and vk == 0x56:  # Ctrl+V
-                self._handle_paste()
-            else:
-                # Convert VK to character (handles shift for !@# etc.)
-                char = vk_to_char(vk)
-                if char:
-                    self.text_buffer += char
-                    self._send_update()
+        # Edits are queued behind any pending paste so they apply in key order
+        if vk == VK_RETURN:
+            with self._lock:
+                self._deactivate()
+            self._queue_work(self._submit)
+        elif vk == VK_ESCAPE:
+            with self._lock:
+                self._deactivate()
+            self._queue_work(self._cancel)
+        elif vk == VK_BACK:
+            self._queue_work(self._backspace)
+        elif vk == VK_SPACE:
+            self._queue_work(self._type, ' ')
+        elif vk == VK_TAB:
+            self._queue_work(self._type, '    ')
+        elif mods & MOD_CTRL and vk == 0x56:  # Ctrl+V
+            self._queue_work(self._handle_paste)  # Clipboard read can block
+        else:
+            # Convert VK to character (handles shift for !@# etc.). Stays on
+            # the hook thread: keyboard state is per-thread in Win32.
+            char = vk_to_char(vk, mods, data.scanCode)
+            if char:
+                self._queue_work(self._type, char)
 
         # Suppress key from reaching game
         self.listener.suppress_event()
 
+    def _capture_vision(self):
+        """Worker: trigger a vision capture (optional feature)."""
+        try:
+            from vision_agent import get_agent
+            agent = get_agent()
+            if agent:
+                agent.capture_now()
+        except Exception:
+            pass  # Vision capture is optional
+
     def _handle_paste(self):
+        """Worker: append clipboard text to the open chat."""
         try:
             text = pyperclip.paste()
             if text:
                 text = text.replace('\r\n', ' ').replace('\n', ' ')
-                text = ''.join(c for c in text if c.isprintable())
-                self.text_buffer += text
-                self._send_update()
+                text = text.translate(_PASTE_STRIP)
+                if not text.isprintable():
+                    text = ''.join(c for c in text if c.isprintable())
+                self._type(text)
         except Exception as e:
             print(f"[InputCapture] Paste error: {e}")
 
-    def _submit(self):
-        text = self.text_buffer.strip()
+    def _deactivate(self):
+        """Close chat for the hook (called with self._lock held)."""
         self.active = False
         self._deactivate_time = time.time()
+
+    def _open(self):
+        """Worker: start a fresh chat buffer."""
+        self._clear_text()
+        self._send_update(True)
+
+    def _type(self, text):
+        """Worker: append typed or pasted text."""
+        self._append_text(text)
+        self._schedule_update()
+
+    def _backspace(self):
+        """Worker: delete the last character."""
+        if self._text_chars:
+            self._text_chars.pop()
+            self._text_dirty = True
+            self._schedule_update()
+
+    def _submit(self):
+        """Worker: send the finished message (includes any paste queued before Enter)."""
+        self._update_pending = False  # chat_submit carries the final text
+        text = self.text_buffer.strip()
         if text:
             print(f"[InputCapture] Submit: {text}")
-            self._send_message("chat_submit", text)
+            self._deliver({"type": "chat_submit", "text": text, "active": False})
         else:
-            self._send_message("chat_input", "", active=False)
-        self.text_buffer = ""
+            self._deliver({"type": "chat_input", "text": "", "active": False})
+        self._clear_text()
 
     def _cancel(self):
-        self.active = False
-        self._deactivate_time = time.time()
-        self.text_buffer = ""
+        """Worker: discard the chat buffer."""
         print("[InputCapture] Cancelled")
-        self._send_update()
+        self._close()
+
+    def _close(self):
+        """Worker: discard the chat buffer and report chat closed."""
+        self._clear_text()
+        self._send_update(False)
 
     def force_close(self, reason=""):
-        if self.active:
-            with self._lock:
-                self.active = False
-                self._deactivate_time = time.time()
-                self.text_buffer = ""
-            print(f"[InputCapture] Force closed: {reason}")
-            self._send_update()
-
-    def _send_update(self):
-        self._send_message("chat_input", self.text_buffer, active=self.active)
-
-    def _send_message(self, msg_type, text, active=None):
-        if active is None:
-            active = self.active
-        msg = {"type": msg_type, "text": text, "active": active}
+        with self._lock:
+            if not self.active:
+                return
+            self._deactivate()
+        self._queue_work(self._close)
+        print(f"[InputCapture] Force closed: {reason}")
+
+    def _send_update(self, active):
+        """Worker: send the chat state now (open/close); supersedes a pending flush."""
+        self._update_pending = False
+        self._deliver({"type": "chat_input", "text": self.text_buffer, "active": active})
+
+    def _schedule_update(self):
+        """Worker: send the chat state after UPDATE_COALESCE_INTERVAL (typing edits).
+
+        Edits applied before the flush runs ride along in the same message.
+        """
+        if not self._update_pending:
+            self._update_pending = True
+            self._update_due = time.monotonic() + UPDATE_COALESCE_INTERVAL
+            self._queue_work(self._flush_update)
+
+    def _flush_update(self):
+        """Worker: send the coalesced chat_input, unless already superseded."""
+        delay = self._update_due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        if not self._update_pending:
+            return  # Submit/cancel/close sent the state already
+        self._update_pending = False
+        self._deliver({"type": "chat_input", "text": self.text_buffer, "active": True})
+
+    def _deliver(self, msg):
+        """Worker: send one message to the game."""
         try:
             self.send(msg)
         except Exception as e:
@@ -297,6 +460,12 @@ class ChatInputCapture:
             self.listener.stop()
             self.listener = None
             print("[InputCapture] Stopped")
+        if self._worker is not None:
+            try:
+                self._work_q.put(None, timeout=1.0)  # Worker exits after pending work
+            except queue.Full:
+                pass
+            self._worker = None  # start() brings up a new one
 
     def set_hotkey(self, hotkey):
         self.hotkey_name = hotkey.lower()
@@ -13,12 +13,15 @@ Protection mechanisms (same as input_capture.py):
 """
 import threading
 import time
-import ctypes
 import os
+import queue
 from pynput import keyboard, mouse
 import sounddevice as sd
 import numpy as np
 
+from utils.settings import load_settings_cached
+from .win32 import user32, is_game_window_active
+
 # Sound file paths (wav for winsound compatibility)
 # sounds/ is at sonorus root, not in input/
 _SONORUS_DIR = os.path.dirname(os.path.dirname(__file__))
@@ -27,6 +30,9 @@ _SOUND_ON = os.path.join(_SOUNDS_DIR, 'stt-on.wav')
 _SOUND_OFF = os.path.join(_SOUNDS_DIR, 'stt-off.wav')
 _SOUND_ERR = os.path.join(_SOUNDS_DIR, 'stt-err.wav')
 
+# Recording buffer capacity; audio past this is dropped (buffer is preallocated)
+MAX_RECORDING_SECONDS = 120
+
 
 def _play_sound(path, delay=0):
     """Play a wav file in background thread (non-blocking)."""
@@ -46,7 +52,35 @@ def play_error_sound():
     _play_sound(_SOUND_ERR)
 
 
-user32 = ctypes.windll.user32
+# The key/mouse filters run inside Windows low-level hooks, which Windows drops
+# if they are slow to return. They only flip recording state; opening/closing
+# the mic stream, settings loads, sounds and vision capture run here, in order.
+_work_q = queue.Queue(maxsize=64)
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _work_loop():
+    while True:
+        fn, args = _work_q.get()
+        try:
+            fn(*args)
+        except Exception as e:
+            print(f"[STT] Worker error in {fn.__name__}: {e}")
+
+
+def _queue_work(fn, *args):
+    """Run fn(*args) on the shared STT worker thread (FIFO), starting it on first use."""
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = threading.Thread(target=_work_loop, daemon=True)
+                _worker.start()
+    try:
+        _work_q.put_nowait((fn, args))
+    except queue.Full:
+        print(f"[STT] Work queue full, dropped {fn.__name__}")
 
 # Windows message types
 WM_KEYDOWN = 0x0100
@@ -96,28 +130,6 @@ def is_key_pressed(vk):
     return (user32.GetAsyncKeyState(vk) & 0x8000) != 0
 
 
-def get_active_window_title():
-    """Get the title of the active window."""
-    try:
-        hwnd = user32.GetForegroundWindow()
-        if not hwnd:
-            return ""
-        length = user32.GetWindowTextLengthW(hwnd)
-        if length == 0:
-            return ""
-        buffer = ctypes.create_unicode_buffer(length + 1)
-        user32.GetWindowTextW(hwnd, buffer, length + 1)
-        return buffer.value
-    except:
-        return ""
-
-
-def is_game_window_active():
-    """Check if Hogwarts Legacy window is active."""
-    title = get_active_window_title().lower().strip()
-    return title == "hogwarts legacy"
-
-
 class STTCapture:
     """Push-to-talk audio capture with STT transcription."""
 
@@ -136,7 +148,8 @@ class STTCapture:
 
         # Recording state
         self.recording = False
-        self.audio_buffer = []
+        self._audio = None  # Preallocated int16 (frames, channels) buffer of the current recording
+        self._audio_len = 0  # Frames written to self._audio
         self._lock = threading.Lock()
         self._stop_time = 0  # Timestamp of last recording stop (anti-repeat)
         self._current_sample_rate = 16000  # Set when recording starts
@@ -222,10 +235,8 @@ class STTCapture:
             return
 
         # Check modifier states - let Alt/Win combos through (system shortcuts)
-        alt_pressed = is_key_pressed(VK_MENU) or is_key_pressed(VK_LMENU) or is_key_pressed(VK_RMENU)
-        win_pressed = is_key_pressed(VK_LWIN) or is_key_pressed(VK_RWIN)
-
-        if alt_pressed or win_pressed:
+        # (VK_MENU covers both Alt keys, so no separate L/R probes)
+        if is_key_pressed(VK_MENU) or is_key_pressed(VK_LWIN) or is_key_pressed(VK_RWIN):
             return
 
         # === NOT RECORDING (key down to start) ===
@@ -262,129 +273,157 @@ class STTCapture:
             self.keyboard_listener.suppress_event()
 
     def _start_recording(self):
-        """Begin audio capture."""
-        t0 = time.time()
+        """Begin audio capture (called from the hook: marks state, worker opens the stream)."""
         with self._lock:
-            t1 = time.time()
             if self.recording:
                 return
-
             self.recording = True
-            self.audio_buffer = []
+        _queue_work(self._open_stream)
+
+    def _open_stream(self):
+        """Worker: open and start the microphone stream for the current recording.
 
-            # Load settings fresh for hot-reload support
-            from utils.settings import load_settings
-            settings = load_settings()
+        Only the worker creates/stops streams, so the PortAudio calls run
+        outside self._lock; the lock only guards state the hook also touches.
+        """
+        t0 = time.time()
+        # Settings are re-read only when settings.json changed (hot-reload),
+        # and outside the lock so a disk read never gates the hook
+        stt_settings = load_settings_cached().get('stt', {})
+        sample_rate = stt_settings.get('sample_rate', 16000)
+        channels = stt_settings.get('channels', 1)
+        audio = np.empty((int(MAX_RECORDING_SECONDS * sample_rate), channels), dtype=np.int16)
+        audio_raw = memoryview(audio).cast('B')  # Byte view for the raw callback
+        frame_bytes = audio.itemsize * channels
+        t1 = time.time()
+        with self._lock:
             t2 = time.time()
-            stt_settings = settings.get('stt', {})
-            sample_rate = stt_settings.get('sample_rate', 16000)
-            channels = stt_settings.get('channels', 1)
+            if not self.recording:
+                return  # Stopped/cancelled before the stream opened
             self._current_sample_rate = sample_rate  # Store for _stop_recording
+            self._audio = audio
+            self._audio_len = 0
+
+        # Raw audio callback: indata is PortAudio's buffer (no numpy wrapper),
+        # copied straight into the preallocated recording buffer
+        def audio_callback(indata, frames, time_info, status):
+            if status:
+                print(f"[STT] Audio status: {status}")
+            if self.recording and self._audio is audio:
+                pos = self._audio_len
+                n = min(frames, len(audio) - pos)
+                audio_raw[pos * frame_bytes:(pos + n) * frame_bytes] = memoryview(indata)[:n * frame_bytes]
+                self._audio_len = pos + n
 
-            # Audio callback for sounddevice stream
-            def audio_callback(indata, frames, time_info, status):
-                if status:
-                    print(f"[STT] Audio status: {status}")
-                if self.recording:
-                    self.audio_buffer.append(indata.copy())
+        try:
+            stream = sd.RawInputStream(
+                samplerate=sample_rate,
+                channels=channels,
+                dtype='int16',
+                callback=audio_callback,
+                blocksize=512,
+                latency='low'
+            )
+            t3 = time.time()
+            stream.start()
+            t4 = time.time()
+        except Exception as e:
+            print(f"[STT] Failed to start recording: {e}")
+            _play_sound(_SOUND_ERR)
+            with self._lock:
+                if self._audio is audio:
+                    self.recording = False
+                    self._audio = None
+            return
 
-            try:
-                self._stream = sd.InputStream(
-                    samplerate=sample_rate,
-                    channels=channels,
-                    dtype='int16',
-                    callback=audio_callback,
-                    blocksize=512,
-                    latency='low'
-                )
-                t3 = time.time()
-                self._stream.start()
-                t4 = time.time()
-
-                # Trigger vision capture for fresh context while user is speaking
-                try:
-                    from vision_agent import get_agent
-                    agent = get_agent()
-                    if agent:
-                        agent.capture_now()
-                except Exception:
-                    pass  # Vision capture is optional
-
-                _play_sound(_SOUND_ON)
-                t5 = time.time()
-                print(f"[STT] Recording started (lock:{(t1-t0)*1000:.0f}ms settings:{(t2-t1)*1000:.0f}ms stream_create:{(t3-t2)*1000:.0f}ms stream_start:{(t4-t3)*1000:.0f}ms sound:{(t5-t4)*1000:.0f}ms)")
-            except Exception as e:
-                print(f"[STT] Failed to start recording: {e}")
-                _play_sound(_SOUND_ERR)
-                self.recording = False
+        # Published even if the key was released meanwhile: the stop/cancel
+        # work queued by the hook runs next on this worker and closes it
+        with self._lock:
+            self._stream = stream
+            if not self.recording:
+                return
+
+        # Trigger vision capture for fresh context while user is speaking
+        try:
+            from vision_agent import get_agent
+            agent = get_agent()
+            if agent:
+                agent.capture_now()
+        except Exception:
+            pass  # Vision capture is optional
+
+        _play_sound(_SOUND_ON)
+        t5 = time.time()
+        print(f"[STT] Recording started (settings:{(t1-t0)*1000:.0f}ms lock:{(t2-t1)*1000:.0f}ms stream_create:{(t3-t2)*1000:.0f}ms stream_start:{(t4-t3)*1000:.0f}ms sound:{(t5-t4)*1000:.0f}ms)")
 
     def _cancel_recording(self):
-        """Cancel recording without transcribing."""
+        """Cancel recording without transcribing (called from the hook)."""
         with self._lock:
             if not self.recording:
                 return
-
             self.recording = False
             self._stop_time = time.time()
+            self._audio = None
+        _queue_work(self._discard_recording)
 
-            # Stop stream
-            if self._stream:
-                try:
-                    self._stream.stop()
-                    self._stream.close()
-                except:
-                    pass
-                self._stream = None
+    def _close_stream(self):
+        """Worker: take the current stream under the lock, stop it outside."""
+        with self._lock:
+            stream, self._stream = self._stream, None
+        if stream:
+            try:
+                stream.stop()
+                stream.close()
+            except:
+                pass
 
-            self.audio_buffer = []
-            print("[STT] Recording cancelled")
+    def _discard_recording(self):
+        """Worker: close the stream of a cancelled recording."""
+        self._close_stream()
+        print("[STT] Recording cancelled")
 
     def _stop_recording(self):
-        """Stop recording and transcribe."""
+        """Stop recording and transcribe (called from the hook)."""
         with self._lock:
             if not self.recording:
                 return
-
             self.recording = False
             self._stop_time = time.time()
+            # Hand this recording's audio over; a new recording gets a fresh buffer
+            audio_data = None
+            if self._audio is not None:
+                audio_data = self._audio[:self._audio_len]
+            self._audio = None
+        _queue_work(self._finish_recording, audio_data)
+
+    def _finish_recording(self, audio_data):
+        """Worker: close the stream and transcribe the recorded audio."""
+        self._close_stream()
+        _play_sound(_SOUND_OFF)
+
+        if audio_data is None or not len(audio_data):
+            print("[STT] No audio recorded")
+            return
 
-            # Stop stream
-            if self._stream:
-                try:
-                    self._stream.stop()
-                    self._stream.close()
-                except:
-                    pass
-                self._stream = None
-
-            _play_sound(_SOUND_OFF)
-
-            # Combine audio chunks
-            if not self.audio_buffer:
-                print("[STT] No audio recorded")
-                return
-
-            audio_data = np.concatenate(self.audio_buffer)
-            audio_bytes = audio_data.tobytes()
-            duration = len(audio_data) / self._current_sample_rate
-
-            print(f"[STT] Recording stopped ({duration:.1f}s)")
+        audio_bytes = audio_data.tobytes()
+        duration = len(audio_data) / self._current_sample_rate
 
-            # Minimum duration check
-            if duration < 0.3:
-                print("[STT] Recording too short, ignoring")
-                _play_sound(_SOUND_ERR, delay=0.5)
-                return
+        print(f"[STT] Recording stopped ({duration:.1f}s)")
+        if duration >= MAX_RECORDING_SECONDS:
+            print(f"[STT] Recording truncated at {MAX_RECORDING_SECONDS}s")
 
-            # Clear buffer (memory cleanup)
-            self.audio_buffer = []
+        # Minimum duration check
+        if duration < 0.3:
+            print("[STT] Recording too short, ignoring")
+            _play_sound(_SOUND_ERR, delay=0.5)
+            return
 
-            # Transcribe in background thread
-            threading.Thread(
-                target=self._transcribe_async,
-                args=(audio_bytes,),
-                daemon=True
-            ).start()
+        # Transcribe in background thread
+        threading.Thread(
+            target=self._transcribe_async,
+            args=(audio_bytes,),
+            daemon=True
+        ).start()
 
     def _transcribe_async(self, audio_bytes):
         """Transcribe audio in background."""
@@ -0,0 +1,98 @@
+"""
+Shared user32 binding for the input hooks.
+
+Uses a private WinDLL instance (not ctypes.windll.user32) so the prototypes
+declared here don't change how pynput or other modules call the same functions.
+Declaring argtypes/restype once gives ctypes a fixed conversion path instead of
+inferring argument types on every call inside the keyboard hooks.
+
+Also holds the foreground-window helpers the text, voice and hotkey hooks share.
+"""
+import ctypes
+import threading
+import time
+from ctypes import wintypes
+
+user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+user32.GetAsyncKeyState.argtypes = [ctypes.c_int]
+user32.GetAsyncKeyState.restype = wintypes.SHORT
+
+user32.GetKeyState.argtypes = [ctypes.c_int]
+user32.GetKeyState.restype = wintypes.SHORT
+
+user32.GetForegroundWindow.argtypes = []
+user32.GetForegroundWindow.restype = wintypes.HWND
+
+user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+user32.GetWindowTextLengthW.restype = ctypes.c_int
+
+user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+user32.GetWindowTextW.restype = ctypes.c_int
+
+user32.GetKeyboardState.argtypes = [ctypes.POINTER(ctypes.c_ubyte)]
+user32.GetKeyboardState.restype = wintypes.BOOL
+
+user32.MapVirtualKeyW.argtypes = [wintypes.UINT, wintypes.UINT]
+user32.MapVirtualKeyW.restype = wintypes.UINT
+
+user32.ToUnicode.argtypes = [wintypes.UINT, wintypes.UINT, ctypes.POINTER(ctypes.c_ubyte),
+                             wintypes.LPWSTR, ctypes.c_int, wintypes.UINT]
+user32.ToUnicode.restype = ctypes.c_int
+
+user32.GetKeyboardLayout.argtypes = [wintypes.DWORD]
+user32.GetKeyboardLayout.restype = wintypes.HKL
+
+user32.VkKeyScanW.argtypes = [wintypes.WCHAR]
+user32.VkKeyScanW.restype = wintypes.SHORT
+
+
+# Reused title buffer: one GetWindowTextW call, no length probe or allocation.
+# Longer titles are truncated (they are only compared against the game title).
+_TITLE_BUF_LEN = 256
+_title_buf = ctypes.create_unicode_buffer(_TITLE_BUF_LEN)
+_title_lock = threading.Lock()
+
+
+def _window_title(hwnd):
+    """Get the title of a window (buffer shared by the text/voice/hotkey hook threads)."""
+    try:
+        with _title_lock:
+            n = user32.GetWindowTextW(hwnd, _title_buf, _TITLE_BUF_LEN)
+            return _title_buf[:n]
+    except:
+        return ""
+
+
+def get_active_window_title():
+    """Get the title of the active window."""
+    try:
+        hwnd = user32.GetForegroundWindow()
+    except:
+        return ""
+    if not hwnd:
+        return ""
+    return _window_title(hwnd)
+
+
+# Foreground check result is reused while the same window stays in front: the
+# hooks call this per key event. GetForegroundWindow is cheap, the title fetch
+# isn't; a focus change (new HWND) is picked up immediately.
+GAME_WINDOW_CACHE_TTL = 0.1
+_game_window_cache = (None, 0.0, False)  # (hwnd, checked_at, active), swapped as one tuple
+
+
+def is_game_window_active():
+    """Check if Hogwarts Legacy window is in foreground (cached per HWND for GAME_WINDOW_CACHE_TTL)."""
+    global _game_window_cache
+    try:
+        hwnd = user32.GetForegroundWindow()
+    except:
+        return False
+    now = time.monotonic()
+    cached_hwnd, checked_at, active = _game_window_cache
+    if hwnd == cached_hwnd and now - checked_at < GAME_WINDOW_CACHE_TTL:
+        return active
+    active = bool(hwnd) and _window_title(hwnd).lower().strip() == "hogwarts legacy"
+    _game_window_cache = (hwnd, now, active)
+    return active
@@ -2494,6 +2494,12 @@ def main():
             print(f"[Server] TTS init failed: {e}")
             print("[Server] TTS will attempt to initialize on first use.")
 
+    # Open the audio device and prewarm OpenAL now, not on the first spoken line
+    if AUDIO3D_AVAILABLE:
+        print("[Server] Initializing 3D audio...")
+        if not audio_get_player().init():
+            print("[Server] 3D audio will attempt to initialize on first use.")
+
     print(f"[Server] Starting on http://localhost:{port}")
     print(f"[Server] Config page: http://localhost:{port}/")
     print("[Server] Ready!")
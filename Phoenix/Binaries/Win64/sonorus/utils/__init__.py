@@ -11,6 +11,7 @@ from .settings import (
     CONFIG_HTML,
     DEFAULT_SETTINGS,
     load_settings,
+    load_settings_cached,
     save_settings,
     deep_merge,
     get_setting,
@@ -10,6 +10,27 @@ import socket as sock_lib
 import struct
 import threading
 
+# orjson for message encoding (optional, stdlib json used otherwise)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _encode_message(data: dict) -> bytes:
+    """Encode a message as one newline-terminated JSON line."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass  # e.g. non-str keys - let stdlib json handle it
+    return (json.dumps(data) + "\n").encode()
+
+
+# Room for the largest message (lipsync_start with a full turn of visemes) twice over
+SEND_BUFFER_SIZE = 256 * 1024
+
 
 class LuaSocketServer:
     """TCP server for bidirectional Lua communication."""
@@ -49,6 +70,10 @@ class LuaSocketServer:
             "camYaw": 0, "camPitch": 0,
             "npcX": 0, "npcY": 0, "npcZ": 0
         }
+        # Same positions as floats (camX, camY, camZ, camYaw, npcX, npcY, npcZ) for the
+        # 3D audio thread. Replaced (never mutated) on each update, so readers can
+        # detect a new update by identity.
+        self._position_tuple = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
         # Callbacks for external modules
         self._input_capture = None  # Will be set by server.py
         self._conv_state = None  # Will be set by server.py
@@ -88,6 +113,10 @@ class LuaSocketServer:
                         self.client.close()
                     self.client = client
                     self.client.settimeout(0.1)  # Non-blocking receives
+                    # Small latency-sensitive messages (sync ticks): send immediately, no Nagle delay.
+                    # Batching happens at the application level (one sync message per tick).
+                    self.client.setsockopt(sock_lib.IPPROTO_TCP, sock_lib.TCP_NODELAY, 1)
+                    self.client.setsockopt(sock_lib.SOL_SOCKET, sock_lib.SO_SNDBUF, SEND_BUFFER_SIZE)
                     self._connection_id += 1  # Track new connection for state sync
                 print(f"[Socket] Lua connected from {addr}")
                 # Start receive thread for this client
@@ -103,12 +132,18 @@ class LuaSocketServer:
 
     def send(self, data: dict):
         """Send JSON message to Lua (thread-safe)."""
+        if not self.client:
+            return False
+        try:
+            msg = _encode_message(data)  # Encode outside the lock
+        except Exception as e:
+            print(f"[Socket] Encode failed for {data.get('type', '?')!r}: {e}")
+            return False  # Bad payload, connection is fine
         with self.lock:
             if not self.client:
                 return False
             try:
-                msg = json.dumps(data) + "\n"
-                self.client.sendall(msg.encode())  # sendall ensures complete delivery
+                self.client.sendall(msg)  # sendall ensures complete delivery
                 return True
             except Exception as e:
                 print(f"[Socket] Send failed: {e}")
@@ -378,17 +413,16 @@ class LuaSocketServer:
                 coordinator.on_lipsync_ready(turn_id)
         elif msg_type == "positions":
             # Real-time position updates from Lua (camera + NPC) for 3D audio
-            with self._context_lock:
-                self._positions = {
-                    "camX": msg.get("camX", 0),
-                    "camY": msg.get("camY", 0),
-                    "camZ": msg.get("camZ", 0),
-                    "camYaw": msg.get("camYaw", 0),
-                    "camPitch": msg.get("camPitch", 0),
-                    "npcX": msg.get("npcX", 0),
-                    "npcY": msg.get("npcY", 0),
-                    "npcZ": msg.get("npcZ", 0),
-                }
+            self.set_positions({
+                "camX": msg.get("camX", 0),
+                "camY": msg.get("camY", 0),
+                "camZ": msg.get("camZ", 0),
+                "camYaw": msg.get("camYaw", 0),
+                "camPitch": msg.get("camPitch", 0),
+                "npcX": msg.get("npcX", 0),
+                "npcY": msg.get("npcY", 0),
+                "npcZ": msg.get("npcZ", 0),
+            })
         elif msg_type == "turn_complete":
             # Lua signals that mouth animation for current turn is fully closed
             print("[Socket] Turn complete - mouth closed")
@@ -443,11 +477,37 @@ class LuaSocketServer:
         """Mark that a new turn is starting (clear complete event)."""
         self._turn_complete_event.clear()
 
+    def set_positions(self, positions: dict):
+        """Replace cached positions (thread-safe). Keys as in get_positions()."""
+        try:
+            position_tuple = (
+                float(positions.get("camX", 0)),
+                float(positions.get("camY", 0)),
+                float(positions.get("camZ", 0)),
+                float(positions.get("camYaw", 0)),
+                float(positions.get("npcX", 0)),
+                float(positions.get("npcY", 0)),
+                float(positions.get("npcZ", 0)),
+            )
+        except (TypeError, ValueError):
+            print(f"[Socket] Ignoring malformed positions: {positions}")
+            return
+        with self._context_lock:
+            self._positions = positions
+            self._position_tuple = position_tuple
+
     def get_positions(self):
         """Get cached positions (thread-safe)."""
         with self._context_lock:
             return self._positions.copy()
 
+    def get_position_tuple(self):
+        """Get cached positions as (camX, camY, camZ, camYaw, npcX, npcY, npcZ) floats.
+
+        The tuple is immutable and swapped atomically, so no lock is needed.
+        """
+        return self._position_tuple
+
     def get_game_context(self):
         """Get cached game context (thread-safe)."""
         with self._context_lock:
@@ -160,6 +160,26 @@ def load_settings():
     return DEFAULT_SETTINGS.copy()
 
 
+# load_settings_cached() state: settings.json mtime -> parsed settings
+_SETTINGS_CACHE = {'mtime_ns': None, 'value': None}
+
+
+def load_settings_cached():
+    """Load settings, re-reading the JSON file only when its mtime changes.
+
+    For hot paths that only read settings. The returned dict is shared
+    between callers - do not modify it (use load_settings() to edit/save).
+    """
+    try:
+        mtime_ns = os.stat(SETTINGS_FILE).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if mtime_ns is None or mtime_ns != _SETTINGS_CACHE['mtime_ns']:
+        _SETTINGS_CACHE['value'] = load_settings()
+        _SETTINGS_CACHE['mtime_ns'] = mtime_ns
+    return _SETTINGS_CACHE['value']
+
+
 def save_settings(settings):
     """Save settings to JSON file"""
     try:
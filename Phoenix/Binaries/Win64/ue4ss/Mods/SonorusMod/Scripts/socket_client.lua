@@ -228,6 +228,57 @@ function SocketClient.update()
     end
 end
 
+-- Append streamed [t, jaw, smile, funnel] frames to the current utterance
+local function AppendVisemeFrames(vd, frames)
+    if frames and #frames > 0 then
+        -- Append to existing frames (streaming)
+        if not vd.frames then vd.frames = {} end
+
+        for _, f in ipairs(frames) do
+            table.insert(vd.frames, {
+                t = f[1],
+                jaw = f[2],
+                smile = f[3],
+                funnel = f[4]
+            })
+        end
+        vd.loaded = true
+        print(string.format("[Socket] Received %d viseme frames (total: %d)\n",
+            #frames, #vd.frames))
+    end
+end
+
+-- Correct drift between our clock and the actual audio position
+-- Python sends this every ~100ms during playback
+local function ApplyAudioSync(vd, audioPosition, turnId)
+    -- Only process if this is for the current turn
+    if _G.SonorusState and _G.SonorusState.currentTurnId == turnId then
+        local now = os.clock()
+        local localElapsed = now - vd.localStartTime  -- Our estimate of audio position
+        local drift = audioPosition - localElapsed     -- Positive = we're behind, negative = we're ahead
+
+        -- Update offset for drift correction
+        -- Use smoothing to avoid sudden jumps (lerp toward new offset)
+        local alpha = 0.3  -- How fast to correct (0.3 = 30% toward new value each update)
+        vd.audioOffset = (vd.audioOffset or 0) * (1 - alpha) + drift * alpha
+
+        -- Store for debugging
+        vd.lastAudioSync = {
+            audioPos = audioPosition,
+            localElapsed = localElapsed,
+            drift = drift,
+            offset = vd.audioOffset,
+            time = now
+        }
+
+        -- Only log very large drift (> 200ms) and only once per session
+        if math.abs(drift) > 0.2 and not vd.syncPrinted then
+            vd.syncPrinted = true
+            print(string.format("[Socket] Large drift detected: %.0fms\n", drift * 1000))
+        end
+    end
+end
+
 function SocketClient.handleMessage(data)
     local msgType = data.type
 
@@ -418,55 +469,19 @@ function SocketClient.handleMessage(data)
 
     elseif msgType == "visemes" then
         -- Batch of viseme frames received
-        local frames = data.frames
-        if frames and #frames > 0 then
-            -- Append to existing frames (streaming)
-            if not vd.frames then vd.frames = {} end
-
-            for _, f in ipairs(frames) do
-                table.insert(vd.frames, {
-                    t = f[1],
-                    jaw = f[2],
-                    smile = f[3],
-                    funnel = f[4]
-                })
-            end
-            vd.loaded = true
-            print(string.format("[Socket] Received %d viseme frames (total: %d)\n",
-                #frames, #vd.frames))
-        end
+        AppendVisemeFrames(vd, data.frames)
 
     elseif msgType == "audio_sync" then
         -- Audio position sync from Python - correct drift between our clock and actual audio
-        -- Python sends this every ~100ms during playback
-        local audioPosition = data.position  -- Actual audio playback position in seconds
-        local turnId = data.turn_id
+        ApplyAudioSync(vd, data.position, data.turn_id)
 
-        -- Only process if this is for the current turn
-        if _G.SonorusState and _G.SonorusState.currentTurnId == turnId then
-            local now = os.clock()
-            local localElapsed = now - vd.localStartTime  -- Our estimate of audio position
-            local drift = audioPosition - localElapsed     -- Positive = we're behind, negative = we're ahead
-
-            -- Update offset for drift correction
-            -- Use smoothing to avoid sudden jumps (lerp toward new offset)
-            local alpha = 0.3  -- How fast to correct (0.3 = 30% toward new value each update)
-            vd.audioOffset = (vd.audioOffset or 0) * (1 - alpha) + drift * alpha
-
-            -- Store for debugging
-            vd.lastAudioSync = {
-                audioPos = audioPosition,
-                localElapsed = localElapsed,
-                drift = drift,
-                offset = vd.audioOffset,
-                time = now
-            }
-
-            -- Only log very large drift (> 200ms) and only once per session
-            if math.abs(drift) > 0.2 and not vd.syncPrinted then
-                vd.syncPrinted = true
-                print(string.format("[Socket] Large drift detected: %.0fms\n", drift * 1000))
-            end
+    elseif msgType == "sync" then
+        -- Combined per-tick update from Python's sync loop: new frames and/or position
+        if data.frames then
+            AppendVisemeFrames(vd, data.frames)
+        end
+        if data.position then
+            ApplyAudioSync(vd, data.position, data.turn_id)
         end
 
     elseif msgType == "queue_item" then